@@ -1,6 +1,6 @@
 """
 Alembic environment for FastAPI Starter Kit.
-Uses DATABASE_URL from app.core.database and SQLModel.metadata for autogenerate.
+Uses SYNC_DATABASE_URL from app.core.database and SQLModel.metadata for autogenerate.
 """
 from logging.config import fileConfig
 
@@ -8,7 +8,7 @@ from alembic import context
 from sqlalchemy import pool
 
 # Import app config and models so SQLModel.metadata has all tables
-from app.core.database import DATABASE_URL
+from app.core.database import SYNC_DATABASE_URL
 from app.models.database import DataProcessingRecord, TaskLog  # noqa: F401
 from sqlmodel import SQLModel
 
@@ -17,7 +17,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Set sqlalchemy.url from our app (env wins over alembic.ini)
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+config.set_main_option("sqlalchemy.url", SYNC_DATABASE_URL)
 
 target_metadata = SQLModel.metadata
 
@@ -41,7 +41,7 @@ def run_migrations_online() -> None:
     from sqlalchemy import create_engine
 
     connectable = create_engine(
-        DATABASE_URL,
+        SYNC_DATABASE_URL,
         poolclass=pool.NullPool,
     )
 
@@ -0,0 +1,42 @@
+"""Composite index for task_logs timeline by correlation_id
+
+Revision ID: 002_task_logs_corr_created
+Revises: 001_initial
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002_task_logs_corr_created"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves WHERE correlation_id = ? ORDER BY created_at DESC LIMIT/OFFSET without a
+    # sort step; INCLUDE lets the common columns come from the index alone.
+    op.create_index(
+        "ix_task_logs_corr_created",
+        "task_logs",
+        ["correlation_id", sa.text("created_at DESC")],
+        unique=False,
+        postgresql_include=["service_name", "status"],
+    )
+    # Left prefix of the composite index covers plain correlation_id lookups
+    op.drop_index(op.f("ix_task_logs_correlation_id"), table_name="task_logs")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_task_logs_correlation_id"),
+        "task_logs",
+        ["correlation_id"],
+        unique=False,
+    )
+    op.drop_index("ix_task_logs_corr_created", table_name="task_logs")
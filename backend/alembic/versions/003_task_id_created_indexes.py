@@ -0,0 +1,53 @@
+"""Composite (task_id, created_at) indexes replacing single-column task_id indexes
+
+Revision ID: 003_task_id_created
+Revises: 002_task_logs_corr_created
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_task_id_created"
+down_revision: Union[str, None] = "002_task_logs_corr_created"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows for one task_id come back in created_at order without a sort step; the
+    # left prefix still serves plain task_id lookups, so the old indexes are dropped.
+    op.create_index(
+        "ix_dpr_task_created",
+        "data_processing_records",
+        ["task_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_data_processing_records_task_id"),
+        table_name="data_processing_records",
+    )
+    op.create_index(
+        "ix_task_logs_task_created",
+        "task_logs",
+        ["task_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_task_logs_task_id"), table_name="task_logs")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_task_logs_task_id"), "task_logs", ["task_id"], unique=False
+    )
+    op.drop_index("ix_task_logs_task_created", table_name="task_logs")
+    op.create_index(
+        op.f("ix_data_processing_records_task_id"),
+        "data_processing_records",
+        ["task_id"],
+        unique=False,
+    )
+    op.drop_index("ix_dpr_task_created", table_name="data_processing_records")
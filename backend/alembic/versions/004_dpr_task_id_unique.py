@@ -0,0 +1,52 @@
+"""Partial unique index on data_processing_records.task_id for Celery task ids
+
+Revision ID: 004_dpr_task_id_unique
+Revises: 003_task_id_created
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_dpr_task_id_unique"
+down_revision: Union[str, None] = "003_task_id_created"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sync-path records all share task_id "-", so uniqueness only holds for Celery
+    # task ids. Built CONCURRENTLY so the table stays writable during the migration.
+    # Celery redelivery can have left duplicate rows per task id: keep the latest
+    # (highest id), as the upsert does, otherwise the unique index build fails
+    op.execute(
+        """
+        DELETE FROM data_processing_records a
+        USING data_processing_records b
+        WHERE a.task_id <> '-' AND a.task_id = b.task_id AND a.id < b.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        # A failed earlier CONCURRENTLY build leaves an INVALID index of the same name
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_dpr_task_id")
+        op.create_index(
+            "uq_dpr_task_id",
+            "data_processing_records",
+            ["task_id"],
+            unique=True,
+            postgresql_where=sa.text("task_id <> '-'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_dpr_task_id",
+            table_name="data_processing_records",
+            postgresql_concurrently=True,
+        )
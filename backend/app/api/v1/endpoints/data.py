@@ -1,16 +1,22 @@
 """
 Data router - Controller layer for data processing endpoints.
 Uses async DB session (connection pool, non-blocking).
-"""
-from typing import Union
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+Handlers return ORJSONResponse built from the service's result dict: response_model
+stays for the OpenAPI schema, but FastAPI skips re-validating and re-encoding it.
+"""
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from app.api.v1.deps import get_data_service
+from app.api.v1.deps import SessionDep
 from app.models.schemas import DataRequest, TaskResult
 from app.services.data_service import DataService
 
+try:
+    from app.observability import emit_log as _emit_log
+except ImportError:
+    _emit_log = None
+
 router = APIRouter(prefix="/data", tags=["data"])
 
 _ENDPOINT_PROCESS = "/process"
@@ -18,31 +24,34 @@ _ENDPOINT_PROCESS_ASYNC = "/process-async"
 
 
 def _api_emit_log(body: str, **attrs):
-    try:
-        from app.observability import emit_log
-
-        emit_log(body, attributes={**attrs, "layer": "api"})
-    except Exception:
-        pass
+    if _emit_log is None:
+        return
+    # emit_log swallows its own errors; the batch processor never blocks.
+    _emit_log(body, attributes={**attrs, "layer": "api"})
 
 
 @router.post("/process", response_model=TaskResult, status_code=200)
 async def process_data(
-    request: DataRequest, service: DataService = Depends(get_data_service)
-) -> TaskResult:
+    request: DataRequest, session: SessionDep, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
     """
     Process data synchronously via data service using RabbitMQ.
     Saves the record to database (non-blocking async DB).
+    The end-of-request log is emitted after the response is sent.
     """
     _api_emit_log("api sync request start", endpoint=_ENDPOINT_PROCESS, method="POST")
+    service = DataService(session)
     try:
         result = await service.process_data_sync_and_save(
             payload=request.payload, description=request.description
         )
-        _api_emit_log(
-            "api sync request end", endpoint=_ENDPOINT_PROCESS, status="success"
+        background_tasks.add_task(
+            _api_emit_log,
+            "api sync request end",
+            endpoint=_ENDPOINT_PROCESS,
+            status="success",
         )
-        return result
+        return ORJSONResponse(content=result)
     except ValueError as e:
         _api_emit_log(
             "api sync request end",
@@ -55,38 +64,38 @@ async def process_data(
 
 @router.post("/process-async", response_model=TaskResult, status_code=202)
 def process_data_async(
-    request: DataRequest, service: DataService = Depends(get_data_service)
-) -> TaskResult:
+    request: DataRequest, session: SessionDep, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
     """
     Process data asynchronously via Celery task.
     Returns a task ID that can be used to check status.
+    The end-of-request log is emitted after the response is sent.
     """
     _api_emit_log(
         "api async request start", endpoint=_ENDPOINT_PROCESS_ASYNC, method="POST"
     )
-    result = service.process_data_async(
+    result = DataService(session).process_data_async(
         payload=request.payload, description=request.description
     )
-    _api_emit_log(
+    background_tasks.add_task(
+        _api_emit_log,
         "api async request end",
         endpoint=_ENDPOINT_PROCESS_ASYNC,
         status="accepted",
         task_id=result.get("task_id", ""),
     )
-    return result
+    return ORJSONResponse(status_code=202, content=result)
 
 
 @router.get("/process-async/{task_id}", response_model=TaskResult, status_code=200)
-def get_data_task_status(
-    task_id: str, service: DataService = Depends(get_data_service)
-) -> Union[TaskResult, JSONResponse]:
+def get_data_task_status(task_id: str, session: SessionDep) -> ORJSONResponse:
     """
     Get the status of an async data processing task.
     """
     try:
-        result = service.get_task_status(task_id)
+        result = DataService(session).get_task_status(task_id)
         if result["task_status"] == "Processing":
-            return JSONResponse(status_code=202, content=result)
-        return result
+            return ORJSONResponse(status_code=202, content=result)
+        return ORJSONResponse(content=result)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,9 +4,9 @@ Uses async DB session (connection pool, non-blocking).
 """
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 
-from app.api.v1.deps import get_data_service, get_task_repository
+from app.api.v1.deps import SessionDep
 from app.models.schemas import RecordResponse, TaskLogResponse
 from app.repositories.task_repository import TaskRepository
 from app.services.data_service import DataService
@@ -16,58 +16,67 @@ router = APIRouter(prefix="/database", tags=["database"])
 
 @router.get("/records", response_model=List[RecordResponse])
 async def get_processing_records(
+    session: SessionDep,
     limit: int = 10,
     offset: int = 0,
-    service: DataService = Depends(get_data_service),
+    after_id: Optional[int] = None,
 ) -> List[RecordResponse]:
     """
     Get data processing records from database (non-blocking async).
+    For the next page pass the last record's id as after_id (offset is legacy).
     """
-    records = await service.get_processing_records(limit=limit, offset=offset)
-    return [RecordResponse.model_validate(r.model_dump()) for r in records]
+    records = await DataService(session).get_processing_records(
+        limit=limit, offset=offset, after_id=after_id
+    )
+    return [RecordResponse.model_validate(r) for r in records]
 
 
 @router.get("/records/{task_id}", response_model=RecordResponse)
-async def get_processing_record(
-    task_id: str, service: DataService = Depends(get_data_service)
-) -> RecordResponse:
+async def get_processing_record(task_id: str, session: SessionDep) -> RecordResponse:
     """
     Get a specific data processing record by task_id (non-blocking async).
     """
-    record = await service.get_processing_record(task_id)
+    record = await DataService(session).get_processing_record(task_id)
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
-    return RecordResponse(**record)
+    return RecordResponse.model_validate(record)
 
 
 @router.get("/logs", response_model=List[TaskLogResponse])
 async def get_task_logs(
+    session: SessionDep,
     correlation_id: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
-    task_repo: TaskRepository = Depends(get_task_repository),
+    after_id: Optional[int] = None,
 ) -> List[TaskLogResponse]:
     """
     Get task logs from database (non-blocking async).
-    Optionally filter by correlation_id.
+    Optionally filter by correlation_id (newest first, offset-paginated; after_id is
+    rejected with 422); otherwise pass the last log's id as after_id for the next
+    page (offset is legacy).
     """
+    if correlation_id and after_id is not None:
+        raise HTTPException(
+            status_code=422,
+            detail="after_id is not supported with correlation_id; use offset",
+        )
+    task_repo = TaskRepository(session)
     if correlation_id:
         logs = await task_repo.get_logs_by_correlation_id(
             correlation_id=correlation_id, limit=limit, offset=offset
         )
     else:
-        logs = await task_repo.get_logs(limit=limit, offset=offset)
-    return [TaskLogResponse.model_validate(log.model_dump()) for log in logs]
+        logs = await task_repo.get_logs(limit=limit, offset=offset, after_id=after_id)
+    return [TaskLogResponse.model_validate(log) for log in logs]
 
 
 @router.delete("/records/{task_id}", status_code=204)
-async def delete_processing_record(
-    task_id: str, service: DataService = Depends(get_data_service)
-) -> None:
+async def delete_processing_record(task_id: str, session: SessionDep) -> None:
     """
     Delete a data processing record (non-blocking async).
     """
-    deleted = await service.delete_processing_record(task_id)
+    deleted = await DataService(session).delete_processing_record(task_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Record not found")
     return None
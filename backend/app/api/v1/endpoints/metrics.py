@@ -5,17 +5,18 @@ Exposes queue depth (RabbitMQ) and RPC latency/timeouts (in-memory).
 from fastapi import APIRouter
 
 from app.core.metrics import get_rpc_stats
-from app.core.queue_metrics import get_queue_depths
+from app.core.queue_metrics import get_queue_depths_cached
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 
 @router.get("", response_model=dict)
-def get_metrics() -> dict:
+async def get_metrics() -> dict:
     """
     Observability metrics: queue depth and RPC stats.
     Use for backpressure tuning (queue growing, latency, timeouts).
+    Queue depths are cached for about a second to protect the Management API.
     """
-    queues = get_queue_depths()
+    queues = await get_queue_depths_cached()
     rpc = get_rpc_stats()
     return {"queues": queues, "rpc": rpc}
@@ -1,17 +1,84 @@
 """
 Service communication helpers and dependencies.
 """
-import json
+import logging
 import os
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
+import orjson
 import requests
-from sqlmodel import Session
+from requests.adapters import HTTPAdapter
 
 from app.core.database import engine
+from app.core.metrics import record_log_event_dropped
 from app.infrastructure.rabbitmq import EventProducer
 from app.models.database import TaskLog
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session: keep-alive connection pool instead of a new TCP connection per call
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_http.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+# Per-thread EventProducer cache: kombu connections are not thread-safe, and sync RPC
+# runs in the default thread pool, so each worker thread keeps its own connection.
+_producers = threading.local()
+
+
+# task_logs writes are buffered and bulk-inserted by one background thread, so the
+# RPC path never waits on a PostgreSQL round-trip per start/end event.
+_LOG_QUEUE_MAXSIZE = 10_000
+_LOG_BATCH_SIZE = 200
+_LOG_FLUSH_INTERVAL_SECONDS = 0.1
+_log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+_log_writer: Optional[threading.Thread] = None
+_log_writer_lock = threading.Lock()
+
+
+def _insert_task_logs(rows: List[Dict[str, Any]]) -> None:
+    """Insert a batch of task_logs rows in one statement and one commit."""
+    with engine.begin() as conn:
+        conn.execute(TaskLog.__table__.insert(), rows)
+
+
+def _run_task_log_writer() -> None:
+    """Drain the log queue: flush every _LOG_BATCH_SIZE rows or _LOG_FLUSH_INTERVAL_SECONDS."""
+    while True:
+        rows = [_log_queue.get()]
+        deadline = time.monotonic() + _LOG_FLUSH_INTERVAL_SECONDS
+        while len(rows) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _insert_task_logs(rows)
+        except Exception as e:
+            # Best-effort: task_logs must not take down the writer thread
+            record_log_event_dropped(len(rows))
+            logger.error("Dropped %d task_logs rows: %s", len(rows), e)
+
+
+def _ensure_task_log_writer() -> None:
+    """Start the background writer thread on first use (not at import, so forks are safe)."""
+    global _log_writer
+    if _log_writer is not None:
+        return
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = threading.Thread(
+                target=_run_task_log_writer, name="task-log-writer", daemon=True
+            )
+            _log_writer.start()
+
 
 def _write_task_log_sync(
     correlation_id: str,
@@ -21,19 +88,54 @@ def _write_task_log_sync(
     description: str,
     task_type: str,
 ) -> None:
-    """Write a single task log row to task_logs (sync, for use from EventProducer)."""
-    with Session(engine) as session:
-        log = TaskLog(
-            task_id=correlation_id,
-            correlation_id=correlation_id,
-            queue_name=queue_name,
+    """Queue a task log row for task_logs (non-blocking, for use from EventProducer)."""
+    _ensure_task_log_writer()
+    try:
+        _log_queue.put_nowait(
+            {
+                "task_id": correlation_id,
+                "correlation_id": correlation_id,
+                "queue_name": queue_name,
+                "service_name": service_name,
+                "task_type": task_type,
+                "description": description or None,
+                "status": status,
+                # Stamped here: a batch insert would give every row the same now()
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+    except queue.Full:
+        # Drop rather than block the RPC when the DB cannot keep up
+        record_log_event_dropped()
+
+
+def _get_producer(service_name: str) -> EventProducer:
+    """Return this thread's EventProducer for service_name, creating it on first use."""
+    cache = getattr(_producers, "cache", None)
+    if cache is None:
+        cache = _producers.cache = {}
+    producer = cache.get(service_name)
+    if producer is None:
+        producer = EventProducer(
+            username=os.getenv("RABBITMQ_USER", "guest"),
+            password=os.getenv("RABBITMQ_PASSWORD", "welcome1"),
+            host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
+            port=int(os.getenv("RABBITMQ_PORT", "5672")),
             service_name=service_name,
-            task_type=task_type,
-            description=description or None,
-            status=status,
+            on_log_event=_write_task_log_sync,
         )
-        session.add(log)
-        session.commit()
+        cache[service_name] = producer
+    return producer
+
+
+def _drop_producer(service_name: str) -> None:
+    """Close and forget this thread's EventProducer so the next call reconnects."""
+    producer = getattr(_producers, "cache", {}).pop(service_name, None)
+    if producer is not None:
+        try:
+            producer.close()
+        except Exception:
+            pass
 
 
 def call_service_via_rabbitmq(
@@ -41,21 +143,18 @@ def call_service_via_rabbitmq(
 ) -> Dict[str, Any]:
     """
     Call a microservice via RabbitMQ using EventProducer (RPC pattern).
+    Reuses a per-thread producer so the AMQP connection is opened once, not per request.
     Raises ValueError with a descriptive message on failure (API layer should map to HTTPException).
     """
     try:
-        event_producer = EventProducer(
-            username=os.getenv("RABBITMQ_USER", "guest"),
-            password=os.getenv("RABBITMQ_PASSWORD", "welcome1"),
-            host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
-            port=int(os.getenv("RABBITMQ_PORT", "5672")),
-            service_name="api_sync",
-            on_log_event=_write_task_log_sync,
-        )
+        event_producer = _get_producer("api_sync")
 
-        response = event_producer.call(queue_name, json.dumps(payload))
-        parsed = json.loads(response)
+        response = event_producer.call(queue_name, payload)
+        parsed = orjson.loads(response)
         if isinstance(parsed, dict) and "error" in parsed:
+            # Broken connection (broker restart, network drop): rebuild on next call
+            if not event_producer.connection.connected:
+                _drop_producer("api_sync")
             raise ValueError(parsed["error"])
         return parsed
     except ValueError:
@@ -72,7 +171,7 @@ def call_service_via_http(
     Raises ValueError on failure (API layer should map to HTTPException).
     """
     try:
-        response = requests.post(service_url, json=payload, timeout=timeout)
+        response = _http.post(service_url, json=payload, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
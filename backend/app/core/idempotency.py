@@ -2,9 +2,12 @@
 Idempotency layer: optional Idempotency-Key header, Redis storage, 1h TTL.
 Sits in front of route handlers; no changes to services or repositories.
 """
-import json
+import asyncio
 import os
-from typing import Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from starlette.datastructures import Headers
 from starlette.responses import Response
@@ -12,44 +15,161 @@ from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Paths that support idempotency (POST only)
 IDEMPOTENT_PATHS = frozenset({"/api/v1/data/process", "/api/v1/data/process-async"})
+# Common prefix of IDEMPOTENT_PATHS: cheap early-out for all other traffic
+IDEMPOTENT_PATH_PREFIX = "/api/v1/data/"
 
 IDEMPOTENCY_HEADER = "idempotency-key"
 IDEMPOTENCY_TTL_SECONDS = 3600  # 1 hour
-REDIS_KEY_PREFIX = "idempotency:"
+# v2: responses are hashes (s, b); v1 keys were SETEX strings and would hit WRONGTYPE
+REDIS_KEY_PREFIX = "idempotency:v2:"
+# In-flight lock: a concurrent request with the same key waits for the first one's
+# response instead of executing the handler again.
+LOCK_KEY_SUFFIX = ":lock"
+# At least the default RPC timeout (EventProducer.call), and renewed while the
+# handler runs, so a slow first request keeps its lock until it finishes
+IDEMPOTENCY_LOCK_TTL_SECONDS = 300
+_LOCK_RENEW_INTERVAL_SECONDS = IDEMPOTENCY_LOCK_TTL_SECONDS / 3
+# The lock holds a per-request token; renew/release only if it is still ours
+_RENEW_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_LOCK_POLL_INITIAL_SECONDS = 0.05
+_LOCK_POLL_MAX_SECONDS = 1.0
+# Per-worker cache in front of Redis for retries that land on the same process
+LOCAL_CACHE_MAXSIZE = 10_000
+LOCAL_CACHE_TTL_SECONDS = 60
 
 
-async def _get_stored(redis, key: str) -> Optional[dict]:
-    """Return stored {status_code, body} or None."""
+async def _get_stored(redis, key: str) -> Optional[Tuple[int, bytes]]:
+    """Return stored (status_code, body) or None."""
     try:
-        raw = await redis.get(key)
+        data = await redis.hgetall(key)
     except Exception:
         return None
-    if not raw:
+    if not data:
         return None
     try:
-        return json.loads(raw.decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError):
+        return int(data[b"s"]), data[b"b"]
+    except (KeyError, ValueError):
         return None
 
 
 async def _set_stored(redis, key: str, status_code: int, body: bytes) -> None:
-    """Store response in Redis with TTL."""
+    """Store response in Redis with TTL (hash: s=status code, b=raw body bytes)."""
     try:
-        payload = json.dumps({"status_code": status_code, "body": body.decode("utf-8")})
-        await redis.setex(key, IDEMPOTENCY_TTL_SECONDS, payload.encode("utf-8"))
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"s": str(status_code), "b": body})
+            pipe.expire(key, IDEMPOTENCY_TTL_SECONDS)
+            await pipe.execute()
     except Exception:
         pass
 
 
+async def _acquire_lock(redis, lock_key: str, token: bytes) -> bool:
+    """SET NX the in-flight lock. True if this request owns it (or Redis is unavailable)."""
+    try:
+        return bool(
+            await redis.set(lock_key, token, nx=True, ex=IDEMPOTENCY_LOCK_TTL_SECONDS)
+        )
+    except Exception:
+        return True
+
+
+async def _renew_lock(redis, lock_key: str, token: bytes) -> None:
+    """Extend the lock TTL periodically while we still own it (cancelled on release)."""
+    while True:
+        await asyncio.sleep(_LOCK_RENEW_INTERVAL_SECONDS)
+        try:
+            renewed = await redis.eval(
+                _RENEW_LOCK_SCRIPT, 1, lock_key, token, IDEMPOTENCY_LOCK_TTL_SECONDS
+            )
+        except Exception:
+            continue
+        if not renewed:
+            return
+
+
+async def _release_lock(redis, lock_key: str, token: bytes) -> None:
+    """Delete the lock only if it still holds our token (compare-and-delete)."""
+    try:
+        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except Exception:
+        pass
+
+
+async def _wait_for_stored(
+    redis, key: str, lock_key: str
+) -> Optional[Tuple[int, bytes]]:
+    """
+    Poll (exponential backoff) for the in-flight request's stored response.
+    Returns None if the lock is released without a stored response, or on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + IDEMPOTENCY_LOCK_TTL_SECONDS
+    delay = _LOCK_POLL_INITIAL_SECONDS
+    while loop.time() < deadline:
+        await asyncio.sleep(delay)
+        stored = await _get_stored(redis, key)
+        if stored is not None:
+            return stored
+        try:
+            if not await redis.exists(lock_key):
+                return None
+        except Exception:
+            return None
+        delay = min(delay * 2, _LOCK_POLL_MAX_SECONDS)
+    return None
+
+
+class _LocalResponseCache:
+    """
+    Bounded LRU with TTL for stored responses, in front of Redis.
+    Only touched from the event loop (no await between get/set), so no lock is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[float, Tuple[int, bytes]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Tuple[int, bytes]) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
 class IdempotencyMiddleware:
     """
     ASGI middleware: optional Idempotency-Key header.
     On hit: return stored response. On miss: run app, capture response, store, return.
+    Concurrent misses for the same key are single-flighted via a Redis SET NX lock.
     """
 
     def __init__(self, app: ASGIApp):
         self.app = app
         self._redis: Optional[object] = None
+        self._local = _LocalResponseCache(LOCAL_CACHE_MAXSIZE, LOCAL_CACHE_TTL_SECONDS)
 
     def _get_redis_url(self) -> str:
         return os.getenv("IDEMPOTENCY_REDIS_URL") or os.getenv(
@@ -71,9 +191,12 @@ class IdempotencyMiddleware:
             await self.app(scope, receive, send)
             return
 
-        method = scope.get("method", "")
         path = scope.get("path", "")
-        if method != "POST" or path not in IDEMPOTENT_PATHS:
+        if (
+            scope.get("method") != "POST"
+            or not path.startswith(IDEMPOTENT_PATH_PREFIX)
+            or path not in IDEMPOTENT_PATHS
+        ):
             await self.app(scope, receive, send)
             return
 
@@ -94,20 +217,28 @@ class IdempotencyMiddleware:
             await self.app(scope, receive, send)
             return
 
+        stored = self._local.get(redis_key)
+        if stored is not None:
+            await self._replay(stored, scope, receive, send)
+            return
+
         stored = await _get_stored(redis, redis_key)
         if stored is not None:
-            status_code = stored.get("status_code", 200)
-            body = stored.get("body", "{}")
-            if isinstance(body, str):
-                body = body.encode("utf-8")
-            response = Response(
-                content=body,
-                status_code=status_code,
-                media_type="application/json",
-            )
-            await response(scope, receive, send)
+            self._local.set(redis_key, stored)
+            await self._replay(stored, scope, receive, send)
             return
 
+        lock_key = f"{redis_key}{LOCK_KEY_SUFFIX}"
+        lock_token = uuid.uuid4().hex.encode()
+        owns_lock = await _acquire_lock(redis, lock_key, lock_token)
+        if not owns_lock:
+            stored = await _wait_for_stored(redis, redis_key, lock_key)
+            if stored is not None:
+                self._local.set(redis_key, stored)
+                await self._replay(stored, scope, receive, send)
+                return
+            # First request failed or timed out without storing: execute this one
+
         # Capture response by wrapping send
         status_code: int = 200
         body_chunks: list = []
@@ -122,6 +253,30 @@ class IdempotencyMiddleware:
                     body_chunks.append(chunk)
             await send(message)
 
-        await self.app(scope, receive, send_wrapper)
-        full_body = b"".join(body_chunks)
-        await _set_stored(redis, redis_key, status_code, full_body)
+        renewer = (
+            asyncio.ensure_future(_renew_lock(redis, lock_key, lock_token))
+            if owns_lock
+            else None
+        )
+        try:
+            await self.app(scope, receive, send_wrapper)
+            full_body = b"".join(body_chunks)
+            self._local.set(redis_key, (status_code, full_body))
+            await _set_stored(redis, redis_key, status_code, full_body)
+        finally:
+            if renewer is not None:
+                renewer.cancel()
+                await _release_lock(redis, lock_key, lock_token)
+
+    @staticmethod
+    async def _replay(
+        stored: Tuple[int, bytes], scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Send a previously stored response."""
+        stored_status, stored_body = stored
+        response = Response(
+            content=stored_body,
+            status_code=stored_status,
+            media_type="application/json",
+        )
+        await response(scope, receive, send)
@@ -1,23 +1,35 @@
 """
-In-memory metrics for observability (RPC latency, timeouts).
+In-memory metrics for observability (RPC latency, timeouts, dropped log events).
 Thread-safe; used by EventProducer and exposed by GET /api/v1/metrics.
 Enables tuning backpressure (queue depth, latency, timeouts).
 """
 import threading
+from bisect import bisect_left, insort
 from collections import deque
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-# Last N RPC latencies in seconds (thread-safe via lock)
+# Last N RPC latencies in seconds (thread-safe via lock).
+# The deque keeps arrival order for eviction; the sorted list holds the same samples
+# in order so percentiles are an index lookup instead of a sort per read.
 _MAX_LATENCIES = 1000
-_latencies: deque = deque(maxlen=_MAX_LATENCIES)
-_counts: Dict[str, int] = {"timeouts": 0}
+_latencies: deque = deque()
+_sorted_latencies: List[float] = []
+_latency_sum = 0.0
+_counts: Dict[str, int] = {"timeouts": 0, "log_events_dropped": 0}
 _lock = threading.Lock()
 
 
 def record_rpc_latency(seconds: float) -> None:
     """Record a successful RPC round-trip duration (seconds)."""
+    global _latency_sum
     with _lock:
+        if len(_latencies) == _MAX_LATENCIES:
+            evicted = _latencies.popleft()
+            del _sorted_latencies[bisect_left(_sorted_latencies, evicted)]
+            _latency_sum -= evicted
         _latencies.append(seconds)
+        insort(_sorted_latencies, seconds)
+        _latency_sum += seconds
 
 
 def record_rpc_timeout() -> None:
@@ -26,24 +38,32 @@ def record_rpc_timeout() -> None:
         _counts["timeouts"] += 1
 
 
+def record_log_event_dropped(count: int = 1) -> None:
+    """Record RPC log events dropped (writer queue full, or a failed batch insert)."""
+    with _lock:
+        _counts["log_events_dropped"] += count
+
+
 def get_rpc_stats() -> Dict[str, Any]:
     """
-    Return RPC metrics: count, avg, p50, p95 (seconds), timeouts_total.
+    Return RPC metrics: count, avg, p50, p95 (seconds), timeouts_total,
+    log_events_dropped_total.
     Percentiles are approximate (from last N samples).
     """
     with _lock:
-        latencies = list(_latencies)
+        n = len(_sorted_latencies)
         timeouts = _counts["timeouts"]
-    if not latencies:
+        log_events_dropped = _counts["log_events_dropped"]
+        if n:
+            avg = _latency_sum / n
+            p50 = _sorted_latencies[int(0.50 * (n - 1))]
+            p95 = _sorted_latencies[int(0.95 * (n - 1))]
+    if not n:
         return {
             "latency_seconds": {"count": 0, "avg": None, "p50": None, "p95": None},
             "timeouts_total": timeouts,
+            "log_events_dropped_total": log_events_dropped,
         }
-    n = len(latencies)
-    sorted_lat = sorted(latencies)
-    avg = sum(latencies) / n
-    p50 = sorted_lat[int(0.50 * (n - 1))] if n else None
-    p95 = sorted_lat[int(0.95 * (n - 1))] if n else None
     return {
         "latency_seconds": {
             "count": n,
@@ -52,4 +72,5 @@ def get_rpc_stats() -> Dict[str, Any]:
             "p95": round(p95, 4),
         },
         "timeouts_total": timeouts,
+        "log_events_dropped_total": log_events_dropped,
     }
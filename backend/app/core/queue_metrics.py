@@ -2,14 +2,28 @@
 Queue depth from RabbitMQ Management API for observability.
 Used by GET /api/v1/metrics to expose queue depth (backpressure signal).
 """
+import asyncio
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import httpx
 
 # Default vhost "/" is URL-encoded as %2F
 _VHOST = "%2F"
 _REQUEST_TIMEOUT = 5
+_DEFAULT_QUEUE_NAMES = ("data_queue", "data_queue_dlq")
+# The Management API only applies name filters to paginated listings (max 500/page)
+_MAX_PAGE_SIZE = 500
+
+# Short TTL so concurrent/frequent scrapes share one Management API round-trip
+_CACHE_TTL_SECONDS = 1.0
+_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+_cache_lock: Optional[asyncio.Lock] = None
+
+# Shared async client (keep-alive pool) for all /metrics requests; closed on app shutdown
+_client: Optional[httpx.AsyncClient] = None
 
 
 def _management_url() -> str:
@@ -26,33 +40,86 @@ def _management_url() -> str:
     return base.rstrip("/")
 
 
-def get_queue_depths(
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use (inside the event loop)."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=_REQUEST_TIMEOUT)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Management API client (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_queue_depths(
     queue_names: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
-    Fetch queue depths from RabbitMQ Management API.
+    Fetch queue depths from RabbitMQ Management API in a single request
+    (one vhost listing filtered server-side to the requested names, so per-producer
+    reply_* queues are never serialized).
     Returns dict keyed by queue name with messages, messages_ready, messages_unacknowledged.
     On error returns {"error": "..."} and no queue keys.
     """
     if queue_names is None:
-        queue_names = ["data_queue", "data_queue_dlq"]
-    base = _management_url()
+        queue_names = list(_DEFAULT_QUEUE_NAMES)
+    url = f"{_management_url()}/api/queues/{_VHOST}"
+    try:
+        resp = await _get_client().get(
+            url,
+            params={
+                "name": "^(" + "|".join(map(re.escape, queue_names)) + ")$",
+                "use_regex": "true",
+                "page": 1,
+                "page_size": min(max(len(queue_names), 1), _MAX_PAGE_SIZE),
+            },
+        )
+        if resp.status_code != 200:
+            return {name: {"error": f"HTTP {resp.status_code}"} for name in queue_names}
+        wanted = set(queue_names)
+        found = {q["name"]: q for q in resp.json()["items"] if q.get("name") in wanted}
+    except httpx.HTTPError as e:
+        return {name: {"error": str(e)} for name in queue_names}
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        return {name: {"error": f"Invalid response: {e}"} for name in queue_names}
     result: Dict[str, Any] = {}
     for name in queue_names:
-        url = f"{base}/api/queues/{_VHOST}/{name}"
-        try:
-            resp = requests.get(url, timeout=_REQUEST_TIMEOUT)
-            if resp.status_code != 200:
-                result[name] = {"error": f"HTTP {resp.status_code}"}
-                continue
-            data = resp.json()
-            result[name] = {
-                "messages": data.get("messages", 0),
-                "messages_ready": data.get("messages_ready", 0),
-                "messages_unacknowledged": data.get("messages_unacknowledged", 0),
-            }
-        except requests.RequestException as e:
-            result[name] = {"error": str(e)}
-        except (KeyError, TypeError) as e:
-            result[name] = {"error": f"Invalid response: {e}"}
+        data = found.get(name)
+        if data is None:
+            result[name] = {"error": "Queue not found"}
+            continue
+        result[name] = {
+            "messages": data.get("messages", 0),
+            "messages_ready": data.get("messages_ready", 0),
+            "messages_unacknowledged": data.get("messages_unacknowledged", 0),
+        }
     return result
+
+
+async def get_queue_depths_cached(
+    queue_names: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    get_queue_depths() memoized for _CACHE_TTL_SECONDS.
+    Concurrent misses are single-flighted: one request fetches, the rest reuse it.
+    """
+    global _cache_lock
+    key = tuple(queue_names) if queue_names is not None else _DEFAULT_QUEUE_NAMES
+    cached = _cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+        return cached[1]
+    if _cache_lock is None:
+        # Created lazily so it binds to the running event loop (Python 3.9)
+        _cache_lock = asyncio.Lock()
+    async with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+            return cached[1]
+        depths = await get_queue_depths(list(key))
+        _cache[key] = (time.monotonic(), depths)
+        return depths
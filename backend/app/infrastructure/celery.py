@@ -8,15 +8,18 @@ before the Celery instrumentor's task_prerun. We copy traceparent/tracestate ont
 the instrumentor's getter (getattr(request, key)) finds them and creates the task span as a child
 of the API span. This works regardless of broker (Redis/RabbitMQ) and Celery message header support.
 """
-import json
 import os
 
+import orjson
 from celery import Celery
 from celery.signals import task_prerun, worker_process_init
 
 # W3C Trace Context keys the instrumentor's getter looks for on task.request
 _TRACEPARENT = "traceparent"
 _TRACESTATE = "tracestate"
+# Payload key the API uses to carry the W3C trace context
+_TRACE_CONTEXT_KEY = "_trace_context"
+_TRACE_CONTEXT_KEY_BYTES = _TRACE_CONTEXT_KEY.encode()
 
 
 app = Celery(
@@ -25,6 +28,12 @@ app = Celery(
     backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
     include=["app.tasks.data"],
 )
+# Task args travel as msgpack (smaller and faster than JSON); results stay JSON.
+app.conf.update(
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="json",
+)
 
 
 @worker_process_init.connect(weak=False)
@@ -60,24 +69,24 @@ def _propagate_trace_context_to_request(sender, task_id, args, kwargs, **extra):
     raw = (args[0] if args else None) or kwargs.get("payload")
     if not raw:
         return
+    # Cheap substring check first: skip parsing payloads that carry no trace context
+    if isinstance(raw, str):
+        if _TRACE_CONTEXT_KEY not in raw:
+            return
+    elif isinstance(raw, bytes):
+        if _TRACE_CONTEXT_KEY_BYTES not in raw:
+            return
     try:
-        payload = json.loads(raw) if isinstance(raw, str) else raw
+        payload = orjson.loads(raw) if isinstance(raw, (str, bytes)) else raw
     except (TypeError, ValueError):
         return
-    carrier = payload.get("_trace_context")
+    carrier = payload.get(_TRACE_CONTEXT_KEY)
     if not carrier or not isinstance(carrier, dict):
         return
-    traceparent = carrier.get(_TRACEPARENT) or carrier.get("traceparent")
-    tracestate = carrier.get(_TRACESTATE) or carrier.get("tracestate")
+    # Values come from inject_trace_context via JSON, so they are already str
+    traceparent = carrier.get(_TRACEPARENT)
     if traceparent:
-        setattr(
-            request,
-            _TRACEPARENT,
-            traceparent if isinstance(traceparent, str) else str(traceparent),
-        )
+        request.traceparent = traceparent
+    tracestate = carrier.get(_TRACESTATE)
     if tracestate:
-        setattr(
-            request,
-            _TRACESTATE,
-            tracestate if isinstance(tracestate, str) else str(tracestate),
-        )
+        request.tracestate = tracestate
@@ -13,27 +13,96 @@ Benefits:
 - Less boilerplate than direct RabbitMQ clients
 - Not tied to any specific project
 """
-import json
+import logging
+import os
+import socket
+import threading
 import time
 import uuid
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
+import orjson
 from kombu import Connection, Consumer, Exchange, Producer, Queue
+from kombu.connection import ConnectionPool
 from kombu.mixins import ConsumerMixin
+from kombu.serialization import register
 
 from app.core.metrics import record_rpc_latency, record_rpc_timeout
+from app.core.serialization import dumps
 
 try:
+    from opentelemetry._logs import SeverityNumber
+
     from app.observability import emit_log as _otel_emit_log
     from app.observability import inject_trace_context
+
+    # Receiver log severities (the log exporter needs the enum, not its int value)
+    _SEVERITY_INFO = SeverityNumber.INFO
+    _SEVERITY_ERROR = SeverityNumber.ERROR
 except ImportError:
     _otel_emit_log = None
     inject_trace_context = None
+    _SEVERITY_INFO = _SEVERITY_ERROR = None
+
+logger = logging.getLogger(__name__)
 
 # Dead letter: exchange and queue name suffixes (main queue + suffix)
 _DLX_SUFFIX = "_dlx"
 _DLQ_SUFFIX = "_dlq"
 
+# Placeholder in EventProducer._pending until the reply for a correlation_id arrives
+_NO_REPLY = object()
+_EMPTY_RESPONSE = orjson.dumps({"error": "Empty response"})
+
+
+def _json_str(body: Any) -> str:
+    return dumps(body).decode()
+
+
+# Decoded message body type -> JSON string for the receiver's service. Exact-type
+# lookup for the common cases; other types go through _body_str's isinstance fallback.
+_BODY_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    dict: _json_str,
+    list: _json_str,
+    bytes: lambda body: body.decode("utf-8"),
+    str: lambda body: body,
+}
+
+# orjson-backed kombu serializer on the standard JSON content type, so peers using
+# kombu's "json" serializer stay wire-compatible. Registering it also makes orjson the
+# application/json decoder for every kombu consumer in this process (Celery included).
+_SERIALIZER = "orjson"
+_ACCEPT = [_SERIALIZER, "json"]
+register(
+    _SERIALIZER,
+    dumps,
+    orjson.loads,
+    content_type="application/json",
+    content_encoding="utf-8",
+)
+
+# Process-wide AMQP connection pools keyed by broker URL. Producers borrow one
+# connection for their lifetime and return it on close(), so re-created producers
+# reuse open TCP connections and the total per process is capped.
+_CONNECTION_POOL_LIMIT = int(os.getenv("RABBITMQ_CONNECTION_POOL_LIMIT", "64"))
+_CONNECTION_ACQUIRE_TIMEOUT = float(
+    os.getenv("RABBITMQ_CONNECTION_ACQUIRE_TIMEOUT", "10")
+)
+_connection_pools: Dict[str, ConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def _get_connection_pool(connection_url: str) -> ConnectionPool:
+    """Return the shared kombu ConnectionPool for connection_url."""
+    pool = _connection_pools.get(connection_url)
+    if pool is None:
+        with _connection_pools_lock:
+            pool = _connection_pools.get(connection_url)
+            if pool is None:
+                pool = Connection(connection_url).Pool(limit=_CONNECTION_POOL_LIMIT)
+                _connection_pools[connection_url] = pool
+    return pool
+
 
 class EventProducer:
     """
@@ -65,70 +134,122 @@ class EventProducer:
             port: RabbitMQ port
             service_name: Name of the service using this producer
             on_log_event: Optional callback (correlation_id, queue_name, service_name,
-                status, description, task_type) to e.g. persist to task_logs
+                status, description, task_type) to e.g. persist to task_logs.
+                Runs on the RPC thread twice per call, so it must not block: hand
+                the event to a bounded queue (see dependencies._write_task_log_sync)
         """
         self.service_name = service_name
         self.on_log_event = on_log_event
 
-        # Create connection URL
+        # Borrow a pooled connection (connects lazily on first use)
         connection_url = f"amqp://{username}:{password}@{host}:{port}//"
-        self.connection = Connection(connection_url)
+        self._connection_pool = _get_connection_pool(connection_url)
+        self.connection = self._connection_pool.acquire(
+            block=True, timeout=_CONNECTION_ACQUIRE_TIMEOUT
+        )
+
+        # Long-lived RPC channel, reply queue and Producer, opened on first call.
+        # Replies are matched to callers by correlation_id via _pending.
+        self._channel = None
+        self._producer: Optional[Producer] = None
+        self._reply_queue_name: Optional[str] = None
+        self._pending: Dict[str, Any] = {}
+        self._publish_lock = threading.Lock()
+        # Target queues already verified on the current RPC channel
+        self._declared_queues: Set[str] = set()
+
+    def _ensure_rpc_channel(self) -> None:
+        """Open the RPC channel, declare the reply queue and start consuming (once)."""
+        if self._channel is not None:
+            return
+        channel = self.connection.channel()
+        try:
+            # Named callback queue (avoid amq.* reserved prefix; use client name)
+            reply_queue_name = f"reply_{uuid.uuid4().hex}"
+            reply_queue = Queue(reply_queue_name, exclusive=True, auto_delete=True)
+            reply_queue.declare(channel=channel)
+            Consumer(
+                channel,
+                queues=[reply_queue],
+                callbacks=[self._on_response],
+                auto_declare=False,
+                accept=_ACCEPT,
+            ).consume()
+        except Exception:
+            channel.close()
+            raise
+        self._producer = Producer(channel)
+        self._reply_queue_name = reply_queue_name
+        self._channel = channel
+
+    def _reset_rpc_channel(self) -> None:
+        """Drop the RPC channel after an error so the next call opens a fresh one."""
+        channel, self._channel = self._channel, None
+        self._producer = None
+        self._reply_queue_name = None
+        self._declared_queues.clear()
+        if channel is not None:
+            try:
+                channel.close()
+            except Exception:
+                pass
 
-    def call(self, queue_name: str, payload: str, timeout: int = 300) -> str:
+    def _on_response(self, body, message):
+        """Store a reply for its waiting call; late replies (after timeout) are dropped."""
+        corr_id = message.properties.get("correlation_id")
+        if corr_id in self._pending:
+            # Store the reply once in its final form (JSON bytes); call() returns it as-is
+            if isinstance(body, str):
+                body = body.encode()
+            elif not isinstance(body, bytes):
+                body = dumps(body) if body else _EMPTY_RESPONSE
+            self._pending[corr_id] = body
+        message.ack()
+
+    def call(
+        self,
+        queue_name: str,
+        payload: Union[Dict[str, Any], str],
+        timeout: int = 300,
+    ) -> bytes:
         """
         Send message to queue and wait for response (RPC pattern).
 
+        Not thread-safe: the underlying kombu connection must be drained by one
+        thread, so keep one EventProducer per thread.
+
         Args:
             queue_name: Name of the queue to send message to
-            payload: Message payload as JSON string
+            payload: Message payload; a dict is encoded once as a JSON object (the
+                consumer receives it parsed), a JSON string is sent as a string
             timeout: Maximum time to wait for response (seconds)
 
         Returns:
-            Response as JSON string
+            Response as UTF-8 JSON bytes
         """
-        response = None
-        corr_id = str(uuid.uuid4())
+        corr_id = uuid.uuid4().hex
         task_type = "data"
         try:
-            payload_dict = json.loads(payload) if isinstance(payload, str) else payload
+            payload_dict = (
+                orjson.loads(payload) if isinstance(payload, str) else payload
+            )
             task_type = payload_dict.get("task_type", "data")
-        except (json.JSONDecodeError, TypeError, AttributeError):
+        except (orjson.JSONDecodeError, TypeError, AttributeError):
             pass
 
-        # Use a dedicated channel for this RPC call
-        channel = self.connection.channel()
-
+        self._pending[corr_id] = _NO_REPLY
         try:
-            # Named callback queue (avoid amq.* reserved prefix; use client name)
-            callback_queue_name = f"reply_{corr_id}"
-            callback_queue = Queue(
-                callback_queue_name,
-                exclusive=True,
-                auto_delete=True,
-            )
-            callback_queue.declare(channel=channel)
-
-            # Set up consumer for response
-            def on_response(body, message):
-                nonlocal response
-                if message.properties.get("correlation_id") == corr_id:
-                    response = body
-                    message.ack()
+            self._ensure_rpc_channel()
 
-            consumer = Consumer(
-                channel,
-                queues=[callback_queue],
-                callbacks=[on_response],
-                auto_declare=True,
-            )
-            consumer.consume()
-
-            # Ensure target queue exists (declare passive to check; skip on error and try publish)
-            try:
-                target_queue = Queue(queue_name, durable=True)
-                target_queue.declare(channel=channel, passive=True)
-            except Exception:
-                pass  # Queue may not exist yet; publish will timeout if no consumer
+            # Ensure target queue exists (declare passive to check; skip on error and try
+            # publish). Checked once per queue for the lifetime of the RPC channel.
+            if queue_name not in self._declared_queues:
+                try:
+                    target_queue = Queue(queue_name, durable=True)
+                    target_queue.declare(channel=self._channel, passive=True)
+                    self._declared_queues.add(queue_name)
+                except Exception:
+                    pass  # Queue may not exist yet; publish will timeout if no consumer
 
             self._log_event(corr_id, queue_name, "start", "-", task_type)
 
@@ -141,57 +262,44 @@ class EventProducer:
                     pass
 
             # Publish message
-            producer = Producer(channel)
-            producer.publish(
-                payload,
-                exchange="",
-                routing_key=queue_name,
-                reply_to=callback_queue_name,
-                correlation_id=corr_id,
-                serializer="json",
-                retry=True,
-                headers=headers,
-            )
+            with self._publish_lock:
+                self._producer.publish(
+                    payload,
+                    exchange="",
+                    routing_key=queue_name,
+                    reply_to=self._reply_queue_name,
+                    correlation_id=corr_id,
+                    serializer=_SERIALIZER,
+                    retry=True,
+                    headers=headers,
+                )
 
-            # Wait for response
-            start_time = time.time()
-            while response is None:
-                if time.time() - start_time > timeout:
+            # Wait for response: block on the socket until the broker pushes a frame,
+            # re-entering only when a delivery did not carry our correlation_id.
+            start_time = time.monotonic()
+            deadline = start_time + timeout
+            while self._pending[corr_id] is _NO_REPLY:
+                try:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise socket.timeout()
+                    self.connection.drain_events(timeout=remaining)
+                except socket.timeout:
                     record_rpc_timeout()
                     self._log_event(corr_id, queue_name, "end", "Timeout", task_type)
-                    consumer.cancel()
-                    channel.close()
-                    return json.dumps({"error": "Request timeout"})
-                try:
-                    self.connection.drain_events(timeout=1)
-                except Exception:
-                    pass  # Timeout is expected, continue waiting
+                    return orjson.dumps({"error": "Request timeout"})
 
-            consumer.cancel()
             self._log_event(corr_id, queue_name, "end", "-", task_type)
-            record_rpc_latency(time.time() - start_time)
-            channel.close()
-
-            # Convert response to JSON string if needed
-            if isinstance(response, dict):
-                return json.dumps(response)
-            elif isinstance(response, str):
-                return response
-            else:
-                return (
-                    json.dumps(response)
-                    if response
-                    else json.dumps({"error": "Empty response"})
-                )
+            record_rpc_latency(time.monotonic() - start_time)
+            return self._pending[corr_id]
         except Exception as e:
-            try:
-                channel.close()
-            except Exception:
-                pass
+            self._reset_rpc_channel()
             self._log_event(
                 corr_id, queue_name, "end", f"Exception: {str(e)}", task_type
             )
-            return json.dumps({"error": f"RabbitMQ call failed: {str(e)}"})
+            return orjson.dumps({"error": f"RabbitMQ call failed: {str(e)}"})
+        finally:
+            self._pending.pop(corr_id, None)
 
     def _log_event(
         self,
@@ -232,14 +340,24 @@ class EventProducer:
                 pass
 
     def close(self):
-        """Close connection."""
-        if self.connection:
-            self.connection.close()
+        """Close the RPC channel and return the connection to the pool."""
+        self._reset_rpc_channel()
+        connection, self.connection = self.connection, None
+        if connection is None:
+            return
+        if connection.connected:
+            connection.release()
+        else:
+            # Broken or never used: discard it and free the pool slot
+            self._connection_pool.replace(connection)
 
 
 class EventReceiver(ConsumerMixin):
     """
     RabbitMQ event receiver using kombu for listening to queues.
+
+    With batch_size > 1, messages are buffered and handed to the service together
+    (service.call_batch when available), replied to, then acked with one multi-ack.
     """
 
     def __init__(
@@ -251,6 +369,8 @@ class EventReceiver(ConsumerMixin):
         queue_name: str,
         service: Callable,
         service_name: str,
+        batch_size: int = 1,
+        batch_timeout_ms: int = 50,
     ):
         """
         Initialize EventReceiver with kombu.
@@ -261,18 +381,40 @@ class EventReceiver(ConsumerMixin):
             host: RabbitMQ host
             port: RabbitMQ port
             queue_name: Name of the queue to listen to
-            service: Service class that processes messages
+            service: Service class that processes messages; instantiated once and
+                reused for every message (messages are handled on the consumer thread)
             service_name: Name of the service
+            batch_size: Messages per batch (1 = process each message on its own)
+            batch_timeout_ms: Max time to hold a partial batch before flushing it
         """
         self.service_worker = service
+        self._service_instance = service()
         self.service_name = service_name
         self.queue_name = queue_name
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout_ms / 1000.0
+        self._buffer: List[Tuple[Any, Any]] = []
+        self._batch_deadline = 0.0
+        # Reply Producers keyed by id(channel); rebuilt when the consumer reconnects
+        self._producer_cache: Dict[int, Producer] = {}
+        # Fields shared by every error reply
+        self._error_template: Dict[str, Any] = {
+            "error": "Receiver exception",
+            "queue": queue_name,
+            "service_name": service_name,
+        }
 
         # Create connection
         connection_url = f"amqp://{username}:{password}@{host}:{port}//"
         self.connection = Connection(connection_url)
 
-        print(f"Awaiting requests from [x] {queue_name} [x]")
+        logger.info("Awaiting requests from [x] %s [x]", queue_name)
+
+    def run(self, _tokens=1, **kwargs):
+        """Start consuming; in batch mode wake at least every batch_timeout to flush."""
+        if self.batch_size > 1:
+            kwargs.setdefault("safety_interval", self.batch_timeout)
+        super().run(_tokens, **kwargs)
 
     def get_consumers(self, Consumer, channel):
         """Set up consumer for the queue with Dead Letter Exchange and DLQ."""
@@ -296,65 +438,202 @@ class EventReceiver(ConsumerMixin):
             },
         )
         return [
-            Consumer(queues=[main_queue], callbacks=[self.on_request], prefetch_count=1)
+            Consumer(
+                queues=[main_queue],
+                callbacks=[self.on_request],
+                prefetch_count=self.batch_size,
+                accept=_ACCEPT,
+            )
         ]
 
+    def on_iteration(self):
+        """Flush a partial batch once batch_timeout has passed since its first message."""
+        if self._buffer and time.monotonic() >= self._batch_deadline:
+            self._flush_batch()
+
+    def on_connection_revived(self):
+        """Forget reply Producers and buffered messages of the previous connection."""
+        self._producer_cache.clear()
+        # Their delivery tags belong to a dead channel; the broker redelivers them
+        self._buffer = []
+
+    def _reply_producer(self, channel) -> Producer:
+        """Return the cached reply Producer for channel, creating it on first use."""
+        producer = self._producer_cache.get(id(channel))
+        if producer is None:
+            producer = self._producer_cache[id(channel)] = Producer(channel)
+        return producer
+
+    @staticmethod
+    def _body_str(body) -> str:
+        """Convert a decoded message body to the JSON string the service expects."""
+        encoder = _BODY_ENCODERS.get(type(body))
+        if encoder is None:
+            # Container subclasses (e.g. OrderedDict) must still go out as JSON
+            encoder = _json_str if isinstance(body, (dict, list)) else str
+        return encoder(body)
+
+    def _error_response(self, correlation_id: str, exc: Exception) -> Dict[str, Any]:
+        return {
+            **self._error_template,
+            "correlation_id": correlation_id,
+            "exception": str(exc),
+        }
+
     def on_request(self, body, message):
-        """Handle incoming message."""
-        service_instance = self.service_worker()
-        correlation_id = message.properties.get("correlation_id", "unknown")
+        """Handle incoming message (buffer it in batch mode)."""
+        if self.batch_size > 1:
+            if not self._buffer:
+                self._batch_deadline = time.monotonic() + self.batch_timeout
+            self._buffer.append((body, message))
+            if len(self._buffer) >= self.batch_size:
+                self._flush_batch()
+            return
+
+        service_instance = self._service_instance
+        props = message.properties
+        correlation_id = props.get("correlation_id", "unknown")
+        reply_to = props.get("reply_to")
 
         self._log_event(correlation_id, "start", "-")
 
+        error = None
         try:
-            # Process message - convert body to string if needed
-            if isinstance(body, dict):
-                body_str = json.dumps(body)
-            elif isinstance(body, bytes):
-                body_str = body.decode("utf-8")
-            else:
-                body_str = str(body)
-
-            response, task_type = service_instance.call(body_str)
+            response, task_type = service_instance.call(self._body_str(body))
+        except Exception as e:
+            error = e
+            response = self._error_response(correlation_id, e)
 
-            # Send response
-            producer = Producer(message.channel)
-            producer.publish(
+        try:
+            self._publish_reply(
+                self._reply_producer(message.channel),
+                reply_to,
+                correlation_id,
                 response,
-                exchange="",
-                routing_key=message.properties.get("reply_to"),
-                correlation_id=correlation_id,
-                serializer="json",
-                retry=True,
             )
+        except Exception as e:
+            # Reply publish failed (channel or broker down): don't try another reply
+            # over the same channel, just reject so the message is dead-lettered
+            if error is None:
+                error = e
+            logger.error("Could not send reply: %s", e)
 
+        if error is None:
             message.ack()
             self._log_event(correlation_id, "end", "-")
-            print(f"Processed request: {task_type}")
+            self._emit("Processed request", _SEVERITY_INFO, task_type=task_type)
+        else:
+            self._log_event(correlation_id, "end", f"Receiver exception: {str(error)}")
+            self._emit("Receiver exception", _SEVERITY_ERROR, exception=str(error))
+            # Reject so message is dead-lettered to DLQ for inspection/retry
+            message.reject(requeue=False)
+
+    @staticmethod
+    def _publish_reply(
+        producer: Producer, reply_to: Optional[str], correlation_id: str, response
+    ):
+        """
+        Publish a reply to the caller's reply queue. The queue is the caller's own and
+        exists while it waits, so skip declaration and retries: if the reply cannot be
+        delivered the caller times out either way.
+        """
+        producer.publish(
+            response,
+            exchange="",
+            routing_key=reply_to,
+            correlation_id=correlation_id,
+            serializer=_SERIALIZER,
+            retry=False,
+            declare=[],
+        )
+
+    def _flush_batch(self):
+        """
+        Process buffered messages together and reply to each. A service failure fails
+        the whole batch (error replies, one multi-nack). A failed reply publish only
+        affects its own message, which is rejected; the rest are acked in one frame
+        when every reply went out, else one by one.
+        """
+        batch, self._buffer = self._buffer, []
+        last = batch[-1][1]
+        producer = self._reply_producer(last.channel)
+        correlation_ids = [
+            m.properties.get("correlation_id", "unknown") for _, m in batch
+        ]
+        reply_tos = [m.properties.get("reply_to") for _, m in batch]
+        for correlation_id in correlation_ids:
+            self._log_event(correlation_id, "start", "-")
 
+        try:
+            bodies = [self._body_str(b) for b, _ in batch]
+            service_instance = self._service_instance
+            call_batch = getattr(service_instance, "call_batch", None)
+            if call_batch is not None:
+                results = call_batch(bodies)
+            else:
+                results = [service_instance.call(b) for b in bodies]
         except Exception as e:
-            response = {
-                "error": "Receiver exception",
-                "queue": self.queue_name,
-                "service_name": self.service_name,
-                "correlation_id": correlation_id,
-                "exception": str(e),
-            }
-
-            producer = Producer(message.channel)
-            producer.publish(
-                response,
-                exchange="",
-                routing_key=message.properties.get("reply_to"),
-                correlation_id=correlation_id,
-                serializer="json",
-                retry=True,
+            for reply_to, correlation_id in zip(reply_tos, correlation_ids):
+                try:
+                    self._publish_reply(
+                        producer,
+                        reply_to,
+                        correlation_id,
+                        self._error_response(correlation_id, e),
+                    )
+                except Exception:
+                    pass
+                self._log_event(correlation_id, "end", f"Receiver exception: {str(e)}")
+            self._emit("Receiver exception", _SEVERITY_ERROR, exception=str(e))
+            # Nack the whole batch without requeue so it is dead-lettered to the DLQ
+            last.channel.basic_nack(
+                delivery_tag=last.delivery_tag, multiple=True, requeue=False
             )
+            return
 
-            self._log_event(correlation_id, "end", f"Receiver exception: {str(e)}")
-            print(f"Receiver exception: {str(e)}")
-            # Reject so message is dead-lettered to DLQ for inspection/retry
-            message.reject(requeue=False)
+        failed: Set[Any] = set()  # delivery tags whose reply could not be sent
+        for (_body, message), reply_to, correlation_id, (response, _task_type) in zip(
+            batch, reply_tos, correlation_ids, results
+        ):
+            try:
+                self._publish_reply(producer, reply_to, correlation_id, response)
+            except Exception as e:
+                logger.error("Could not send reply: %s", e)
+                failed.add(message.delivery_tag)
+                self._log_event(correlation_id, "end", f"Receiver exception: {str(e)}")
+            else:
+                self._log_event(correlation_id, "end", "-")
+
+        if not failed:
+            last.channel.basic_ack(delivery_tag=last.delivery_tag, multiple=True)
+            self._emit("Processed batch", _SEVERITY_INFO, batch_size=len(batch))
+            return
+        for _body, message in batch:
+            if message.delivery_tag in failed:
+                # Reject so message is dead-lettered to DLQ for inspection/retry
+                message.reject(requeue=False)
+            else:
+                message.ack()
+        self._emit(
+            "Processed batch",
+            _SEVERITY_INFO,
+            batch_size=len(batch),
+            failed_replies=len(failed),
+        )
+
+    def _emit(self, body: str, severity_number, **attributes):
+        """Emit an OTel log for the receiver (batched export; replaces stdout prints)."""
+        if _otel_emit_log is not None:
+            _otel_emit_log(
+                body,
+                attributes={
+                    "layer": "receiver",
+                    "queue_name": self.queue_name,
+                    "service_name": self.service_name,
+                    **attributes,
+                },
+                severity_number=severity_number,
+            )
 
     def _log_event(self, correlation_id: str, task_type: str, description: str):
         """Placeholder for observability (use OTel in data service for traces/logs)."""
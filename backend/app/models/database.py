@@ -2,12 +2,15 @@
 Database models using SQLModel.
 
 SQLModel combines SQLAlchemy and Pydantic for type-safe database models.
-The sqlalchemy.func import is for server_default/onupdate timestamps; expected with SQLModel.
+The sqlalchemy imports are for server_default/onupdate timestamps and composite indexes
+(__table_args__); expected with SQLModel. created_at is filled by the database only
+(server_default); eager_defaults returns it from the INSERT via RETURNING, so no
+refresh SELECT is needed after commit.
 """
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import Index, func, text
 from sqlmodel import Column, DateTime, Field, SQLModel
 
 
@@ -18,17 +21,32 @@ class DataProcessingRecord(SQLModel, table=True):
     """
 
     __tablename__ = "data_processing_records"
+    # Fetch server-generated created_at via INSERT ... RETURNING (no refresh SELECT)
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Lookups by task_id, recent first (see alembic 003)
+        Index("ix_dpr_task_created", "task_id", "created_at"),
+        # One record per Celery task; sync records share "-" (see alembic 004)
+        Index(
+            "uq_dpr_task_id",
+            "task_id",
+            unique=True,
+            postgresql_where=text("task_id <> '-'"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: str = Field(index=True)
+    task_id: str
     payload: str
     description: Optional[str] = None
     task_type: str = Field(default="data")
     task_status: str
     outcome: Optional[str] = None
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
     )
     updated_at: Optional[datetime] = Field(
         default=None, sa_column=Column(DateTime(timezone=True), onupdate=func.now())
@@ -42,16 +60,30 @@ class TaskLog(SQLModel, table=True):
     """
 
     __tablename__ = "task_logs"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Timeline per correlation_id, newest first (see alembic 002)
+        Index(
+            "ix_task_logs_corr_created",
+            "correlation_id",
+            text("created_at DESC"),
+            postgresql_include=["service_name", "status"],
+        ),
+        # Timeline per task_id (see alembic 003)
+        Index("ix_task_logs_task_created", "task_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: str = Field(index=True)
-    correlation_id: Optional[str] = Field(default=None, index=True)
+    task_id: str
+    correlation_id: Optional[str] = None
     queue_name: Optional[str] = None
     service_name: str
     task_type: str
     description: Optional[str] = None
     status: str  # start, end, error
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
     )
@@ -4,7 +4,7 @@ Pydantic models for API request/response validation.
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # Data Service Models
@@ -50,10 +50,13 @@ class TaskResult(BaseModel):
     outcome: Optional[Any] = None
 
 
-# Database query response models (Pydantic; use response_model in endpoints)
+# Database query response models (Pydantic; use response_model in endpoints).
+# Endpoints build them from ORM rows with model_validate (from_attributes).
 class RecordResponse(BaseModel):
     """Response model for a single data processing record."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     task_id: str
     payload: str
@@ -68,6 +71,8 @@ class RecordResponse(BaseModel):
 class TaskLogResponse(BaseModel):
     """Response model for a single task log entry."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     task_id: str
     correlation_id: Optional[str] = None
@@ -3,11 +3,28 @@ OpenTelemetry setup: traces, metrics, and logs exported via OTLP to the collecto
 Init once at app startup; when OTEL_EXPORTER_OTLP_ENDPOINT is not set, all signals are no-op.
 """
 import os
+import threading
+import time
 from typing import Any, Dict, Optional
 
+# OTel API modules imported once; per-request helpers are no-ops when it is missing.
+try:
+    from opentelemetry import propagate as _propagate
+    from opentelemetry import trace as _trace
+except ImportError:
+    _propagate = None
+    _trace = None
+
 # Set in init when logs are enabled; used by emit_log().
 _otel_logger = None
 
+# Providers are set up once per process (init_observability may be called again).
+_initialized = False
+_init_lock = threading.Lock()
+
+# How long one get_rpc_stats() snapshot is shared by the RPC gauges (seconds)
+_RPC_SNAPSHOT_TTL = 0.5
+
 
 def _normalize_endpoint(endpoint: str) -> str:
     """Strip http(s) scheme for gRPC."""
@@ -21,14 +38,26 @@ def _normalize_endpoint(endpoint: str) -> str:
 def init_observability(app=None):
     """
     Initialize OpenTelemetry: resource; tracer, meter, and logger providers;
-    OTLP exporters (gRPC); FastAPI auto-instrumentation.
-    Call once from main.py before or after creating the FastAPI app.
+    OTLP exporters (gRPC); FastAPI auto-instrumentation when app is given.
+    Providers are set up once per process; repeated calls only instrument app.
     If OTEL_EXPORTER_OTLP_ENDPOINT is not set, does nothing (no-op).
     """
+    global _initialized
     endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip()
     if not endpoint:
         return
 
+    with _init_lock:
+        if not _initialized:
+            _initialized = True
+            _init_providers(endpoint)
+
+    if app is not None:
+        _instrument_app(app)
+
+
+def _init_providers(endpoint: str) -> None:
+    """Set the global tracer, meter, and logger providers with OTLP exporters."""
     grpc_endpoint = _normalize_endpoint(endpoint)
     service_name = os.getenv("OTEL_SERVICE_NAME", "fastapi-api")
 
@@ -90,28 +119,36 @@ def init_observability(app=None):
     else:
         global _otel_logger
         log_provider = LoggerProvider(resource=resource)
+        # Bounded queue: emit() only enqueues and drops records when the exporter
+        # falls behind, so logging never blocks or raises on the request path.
         log_provider.add_log_record_processor(
             BatchLogRecordProcessor(
-                OTLPLogExporter(endpoint=grpc_endpoint, insecure=True)
+                OTLPLogExporter(endpoint=grpc_endpoint, insecure=True),
+                max_queue_size=2048,
+                max_export_batch_size=512,
+                schedule_delay_millis=1000,
             )
         )
         _logs.set_logger_provider(log_provider)
         _otel_logger = _logs.get_logger(__name__, "1.0.0")
 
-    # --- FastAPI instrumentation (traces) ---
-    # exclude_spans: ASGI sends the response in two steps (response.start, response.body),
-    # so the middleware creates two "http send" spans per request. Excluding receive/send
-    # keeps one server span per request plus any custom spans (e.g. message.process).
-    if app is not None:
-        try:
-            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
-            FastAPIInstrumentor.instrument_app(
-                app,
-                exclude_spans=["receive", "send"],
-            )
-        except ImportError:
-            pass
+def _instrument_app(app) -> None:
+    """
+    FastAPI auto-instrumentation (traces).
+    exclude_spans: ASGI sends the response in two steps (response.start, response.body),
+    so the middleware creates two "http send" spans per request. Excluding receive/send
+    keeps one server span per request plus any custom spans (e.g. message.process).
+    """
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        FastAPIInstrumentor.instrument_app(
+            app,
+            exclude_spans=["receive", "send"],
+        )
+    except ImportError:
+        pass
 
 
 def _register_rpc_metrics(meter_provider) -> None:
@@ -127,34 +164,47 @@ def _register_rpc_metrics(meter_provider) -> None:
 
     meter = meter_provider.get_meter("fastapi-api-rpc", "1.0.0")
 
+    # All five gauges are collected in the same export burst: take one snapshot and
+    # share it instead of calling get_rpc_stats() (and taking its lock) per gauge.
+    snapshot_lock = threading.Lock()
+    snapshot = {"at": 0.0, "stats": None}
+
+    def get_stats() -> Dict[str, Any]:
+        with snapshot_lock:
+            now = time.monotonic()
+            if snapshot["stats"] is None or now - snapshot["at"] >= _RPC_SNAPSHOT_TTL:
+                snapshot["stats"] = get_rpc_stats()
+                snapshot["at"] = now
+            return snapshot["stats"]
+
     def observe_latency_count(_options):
-        stats = get_rpc_stats()
+        stats = get_stats()
         lat = stats.get("latency_seconds") or {}
         yield Observation(lat.get("count") or 0, {})
 
     def observe_latency_avg(_options):
-        stats = get_rpc_stats()
+        stats = get_stats()
         lat = stats.get("latency_seconds") or {}
         avg = lat.get("avg")
         if avg is not None:
             yield Observation(avg, {})
 
     def observe_latency_p50(_options):
-        stats = get_rpc_stats()
+        stats = get_stats()
         lat = stats.get("latency_seconds") or {}
         p50 = lat.get("p50")
         if p50 is not None:
             yield Observation(p50, {})
 
     def observe_latency_p95(_options):
-        stats = get_rpc_stats()
+        stats = get_stats()
         lat = stats.get("latency_seconds") or {}
         p95 = lat.get("p95")
         if p95 is not None:
             yield Observation(p95, {})
 
     def observe_timeouts(_options):
-        stats = get_rpc_stats()
+        stats = get_stats()
         yield Observation(stats.get("timeouts_total", 0), {})
 
     meter.create_observable_gauge(
@@ -191,16 +241,16 @@ def _register_rpc_metrics(meter_provider) -> None:
 
 def _get_trace_context_attributes() -> Dict[str, str]:
     """Return trace_id and span_id from current span for log-trace correlation in SigNoz."""
+    if _trace is None:
+        return {}
     try:
-        from opentelemetry import trace
-
-        span = trace.get_current_span()
+        span = _trace.get_current_span()
         if not span.is_recording():
             return {}
         ctx = span.get_span_context()
         return {
-            "trace_id": format(ctx.trace_id, "032x"),
-            "span_id": format(ctx.span_id, "016x"),
+            "trace_id": ctx.trace_id.to_bytes(16, "big").hex(),
+            "span_id": ctx.span_id.to_bytes(8, "big").hex(),
         }
     except Exception:
         return {}
@@ -209,11 +259,12 @@ def _get_trace_context_attributes() -> Dict[str, str]:
 def emit_log(
     body: str,
     attributes: Optional[Dict[str, Any]] = None,
-    severity_number: Optional[int] = None,
+    severity_number: Optional[Any] = None,
     include_trace_context: bool = True,
 ) -> None:
     """
     Emit a log record to OTLP (SigNoz) when logs are enabled.
+    severity_number must be an opentelemetry._logs.SeverityNumber member.
     When include_trace_context is True, adds trace_id and span_id from the current span
     so logs correlate with traces in SigNoz.
     No-op if OTEL_EXPORTER_OTLP_ENDPOINT was not set or logs SDK unavailable.
@@ -244,10 +295,10 @@ def inject_trace_context(carrier: Dict[str, str]) -> None:
     Enables downstream services to continue the same trace (waterfall).
     No-op if OTel not set up.
     """
+    if _propagate is None:
+        return
     try:
-        from opentelemetry import propagate
-
-        propagate.inject(carrier)
+        _propagate.inject(carrier)
     except Exception:
         pass
 
@@ -257,9 +308,9 @@ def extract_trace_context(carrier: Dict[str, str]):
     Extract trace context from a carrier (e.g. incoming message headers).
     Returns a Context to use as parent when starting a span, or None if none/invalid.
     """
+    if _propagate is None:
+        return None
     try:
-        from opentelemetry import propagate
-
-        return propagate.extract(carrier)
+        return _propagate.extract(carrier)
     except Exception:
         return None
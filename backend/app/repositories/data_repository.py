@@ -4,6 +4,7 @@ Async implementation using SQLModel AsyncSession (connection-pooled).
 """
 from typing import List, Optional
 
+from sqlalchemy import delete, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -41,7 +42,6 @@ class DataRepository:
         )
         self.session.add(record)
         await self.session.commit()
-        await self.session.refresh(record)
         return record
 
     async def get_record_by_id(self, record_id: int) -> Optional[DataProcessingRecord]:
@@ -54,34 +54,58 @@ class DataRepository:
         self, task_id: str
     ) -> Optional[DataProcessingRecord]:
         """
-        Get a record by task ID.
+        Get a record by task ID (the first by id, the row update/delete act on).
         """
-        stmt = select(DataProcessingRecord).where(
-            DataProcessingRecord.task_id == task_id
+        stmt = (
+            select(DataProcessingRecord)
+            .where(DataProcessingRecord.task_id == task_id)
+            .order_by(DataProcessingRecord.id)
+            .limit(1)
         )
         result = await self.session.exec(stmt)
         return result.first()
 
     async def get_records(
-        self, limit: int = 10, offset: int = 0
+        self, limit: int = 10, offset: int = 0, after_id: Optional[int] = None
     ) -> List[DataProcessingRecord]:
         """
-        Get multiple records with pagination.
+        Get multiple records in id order.
+        Pass the last id seen as after_id (keyset pagination, served by the primary
+        key); offset is the legacy path and scans every skipped row.
         """
-        stmt = select(DataProcessingRecord).offset(offset).limit(limit)
+        stmt = select(DataProcessingRecord).order_by(DataProcessingRecord.id)
+        if after_id is not None:
+            stmt = stmt.where(DataProcessingRecord.id > after_id)
+        elif offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
         result = await self.session.exec(stmt)
-        return list(result.all())
+        return result.all()
+
+    @staticmethod
+    def _first_id_for_task(task_id: str):
+        """Scalar subquery: id of the first record for task_id (sync records share "-")."""
+        return (
+            select(DataProcessingRecord.id)
+            .where(DataProcessingRecord.task_id == task_id)
+            .order_by(DataProcessingRecord.id)
+            .limit(1)
+            .scalar_subquery()
+        )
 
     async def delete_record_by_task_id(self, task_id: str) -> bool:
         """
-        Delete a record by task ID.
+        Delete a record by task ID (one DELETE ... RETURNING round trip).
         """
-        record = await self.get_record_by_task_id(task_id)
-        if not record:
-            return False
-        await self.session.delete(record)
+        stmt = (
+            delete(DataProcessingRecord)
+            .where(DataProcessingRecord.id == self._first_id_for_task(task_id))
+            .returning(DataProcessingRecord.id)
+        )
+        result = await self.session.exec(stmt)
+        deleted = result.first() is not None
         await self.session.commit()
-        return True
+        return deleted
 
     async def update_record(
         self,
@@ -90,16 +114,22 @@ class DataRepository:
         outcome: Optional[str] = None,
     ) -> Optional[DataProcessingRecord]:
         """
-        Update a record.
+        Update a record (one UPDATE ... RETURNING round trip).
         """
-        record = await self.get_record_by_task_id(task_id)
-        if not record:
-            return None
+        changes = {}
         if task_status:
-            record.task_status = task_status
+            changes["task_status"] = task_status
         if outcome:
-            record.outcome = outcome
-        self.session.add(record)
+            changes["outcome"] = outcome
+        if not changes:
+            return await self.get_record_by_task_id(task_id)
+        stmt = (
+            update(DataProcessingRecord)
+            .where(DataProcessingRecord.id == self._first_id_for_task(task_id))
+            .values(**changes)
+            .returning(DataProcessingRecord)
+        )
+        result = await self.session.exec(stmt)
+        record = result.scalar_one_or_none()
         await self.session.commit()
-        await self.session.refresh(record)
         return record
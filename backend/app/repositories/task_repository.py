@@ -43,28 +43,37 @@ class TaskRepository:
         )
         self.session.add(log)
         await self.session.commit()
-        await self.session.refresh(log)
         return log
 
     async def get_logs_by_correlation_id(
         self, correlation_id: str, limit: int = 10, offset: int = 0
     ) -> List[TaskLog]:
         """
-        Get logs by correlation ID.
+        Get logs by correlation ID, newest first (served by ix_task_logs_corr_created).
         """
         stmt = (
             select(TaskLog)
             .where(TaskLog.correlation_id == correlation_id)
+            .order_by(TaskLog.created_at.desc())
             .offset(offset)
             .limit(limit)
         )
         result = await self.session.exec(stmt)
-        return list(result.all())
+        return result.all()
 
-    async def get_logs(self, limit: int = 10, offset: int = 0) -> List[TaskLog]:
+    async def get_logs(
+        self, limit: int = 10, offset: int = 0, after_id: Optional[int] = None
+    ) -> List[TaskLog]:
         """
-        Get multiple logs with pagination.
+        Get multiple logs in id order.
+        Pass the last id seen as after_id (keyset pagination, served by the primary
+        key); offset is the legacy path and scans every skipped row.
         """
-        stmt = select(TaskLog).offset(offset).limit(limit)
+        stmt = select(TaskLog).order_by(TaskLog.id)
+        if after_id is not None:
+            stmt = stmt.where(TaskLog.id > after_id)
+        elif offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
         result = await self.session.exec(stmt)
-        return list(result.all())
+        return result.all()
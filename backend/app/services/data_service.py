@@ -4,17 +4,41 @@ Uses async DB (connection-pooled) for non-blocking requests.
 Blocking RabbitMQ RPC is run in a thread pool so the event loop is not blocked.
 """
 import asyncio
-import json
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+from celery import states
 from celery.result import AsyncResult
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.dependencies import call_service, get_queue_name
+from app.core.serialization import dumps
+from app.models.database import DataProcessingRecord
 from app.repositories.data_repository import DataRepository
 from app.repositories.task_repository import TaskRepository
 from app.tasks.data import process_data_task
 
+try:
+    from app.observability import inject_trace_context
+except ImportError:
+    inject_trace_context = None
+
+
+def _dumps(obj: Any) -> str:
+    """JSON-encode obj to str (orjson, stdlib fallback for out-of-range ints)."""
+    return dumps(obj).decode()
+
+
+# Bounded, dedicated pool for blocking RPC calls (instead of the default executor used
+# by asyncio.to_thread). Each thread keeps its own producer (see dependencies), so keep
+# this at or below RABBITMQ_CONNECTION_POOL_LIMIT.
+_RPC_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RPC_THREAD_POOL_SIZE", "32")),
+    thread_name_prefix="rpc",
+)
+
 
 class DataService:
     """
@@ -50,13 +74,16 @@ class DataService:
     ) -> Dict[str, Any]:
         """
         Process via RabbitMQ RPC (in thread pool) and save result to DB (async).
-        Does not block the event loop: blocking RPC runs in asyncio.to_thread().
+        Does not block the event loop: blocking RPC runs in the bounded _RPC_POOL.
         """
-        result = await asyncio.to_thread(
-            self.process_data_sync, payload=payload, description=description
+        result = await asyncio.get_running_loop().run_in_executor(
+            _RPC_POOL,
+            functools.partial(
+                self.process_data_sync, payload=payload, description=description
+            ),
         )
         outcome_str = (
-            json.dumps(result["outcome"])
+            _dumps(result["outcome"])
             if isinstance(result["outcome"], dict)
             else str(result["outcome"])
         )
@@ -79,18 +106,14 @@ class DataService:
         (API → Celery worker → data-service in one trace). See backend celery.py task_prerun.
         """
         request_payload = {"payload": payload, "description": description}
-        try:
-            from app.observability import inject_trace_context
-
+        if inject_trace_context is not None:
             carrier = {}
             inject_trace_context(carrier)
             if carrier:
                 request_payload["_trace_context"] = carrier
-        except Exception:  # pylint: disable=broad-except
-            pass
         # headers={} allows instrumentor to inject too; worker prefers payload for reliability.
         task = process_data_task.apply_async(
-            args=[json.dumps(request_payload)],
+            args=[request_payload],
             headers={},
         )
         return {
@@ -102,30 +125,34 @@ class DataService:
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get the status of an async data processing task (Redis/Celery).
+        Reads the task meta once (one backend GET) instead of ready/failed/get.
         """
-        task = AsyncResult(task_id)
-        if not task.ready():
+        meta = AsyncResult(task_id).backend.get_task_meta(task_id)
+        status = meta["status"]
+        if status not in states.READY_STATES:
             return {"task_id": task_id, "task_status": "Processing", "outcome": None}
-        if task.failed():
-            raise ValueError(f"Task failed: {task.info}")
-        result = task.get()
-        return {"task_id": task_id, "task_status": "Success", "outcome": result}
+        if status != states.SUCCESS:
+            raise ValueError(f"Task failed: {meta['result']}")
+        return {"task_id": task_id, "task_status": "Success", "outcome": meta["result"]}
 
     async def get_processing_records(
-        self, limit: int = 10, offset: int = 0
+        self, limit: int = 10, offset: int = 0, after_id: Optional[int] = None
     ) -> List[Any]:
         """
-        Get data processing records (async DB).
+        Get data processing records (async DB); after_id selects keyset pagination.
         """
-        records = await self.data_repo.get_records(limit=limit, offset=offset)
+        records = await self.data_repo.get_records(
+            limit=limit, offset=offset, after_id=after_id
+        )
         return records
 
-    async def get_processing_record(self, task_id: str) -> Optional[Dict[str, Any]]:
+    async def get_processing_record(
+        self, task_id: str
+    ) -> Optional[DataProcessingRecord]:
         """
         Get a specific processing record by task_id (async DB).
         """
-        record = await self.data_repo.get_record_by_task_id(task_id)
-        return record.model_dump() if record else None
+        return await self.data_repo.get_record_by_task_id(task_id)
 
     async def delete_processing_record(self, task_id: str) -> bool:
         """
@@ -1,15 +1,21 @@
 """
 Data processing Celery tasks.
 """
-import json
 import os
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
+import orjson
 from celery import current_task
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
-from sqlmodel import Session
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.database import engine
+from app.core.serialization import dumps
 from app.infrastructure.celery import app
 from app.infrastructure.rabbitmq import EventProducer
 from app.models.database import DataProcessingRecord
@@ -19,6 +25,167 @@ from app.observability import emit_log
 celery_log = get_task_logger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """JSON-encode obj to str (orjson, stdlib fallback for out-of-range ints)."""
+    return dumps(obj).decode()
+
+
+# Connection settings, read once at import (they never change per task)
+_RABBITMQ_USER = os.getenv("RABBITMQ_USER", "guest")
+_RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "welcome1")
+_RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "rabbitmq")
+_RABBITMQ_PORT = int(os.getenv("RABBITMQ_PORT", "5672"))
+_DATA_QUEUE_NAME = os.getenv("DATA_QUEUE_NAME", "data_queue")
+
+# One EventProducer per worker process, reused by every task so the AMQP connection,
+# RPC channel and reply queue stay open. Created after fork (never in the parent).
+_producer: Optional[EventProducer] = None
+_producer_lock = threading.Lock()
+
+
+def _get_producer() -> EventProducer:
+    """Return this worker process's EventProducer, creating it on first use."""
+    global _producer
+    with _producer_lock:
+        if _producer is None:
+            _producer = EventProducer(
+                username=_RABBITMQ_USER,
+                password=_RABBITMQ_PASSWORD,
+                host=_RABBITMQ_HOST,
+                port=_RABBITMQ_PORT,
+                service_name="api_celery_worker",
+            )
+        return _producer
+
+
+def _reset_producer() -> None:
+    """Close and forget the cached EventProducer so the next task reconnects."""
+    global _producer
+    with _producer_lock:
+        producer, _producer = _producer, None
+    if producer is not None:
+        try:
+            producer.close()
+        except Exception:
+            pass
+
+
+def _call_via_producer(queue_name: str, payload: Dict[str, Any]) -> bytes:
+    """
+    RPC through the cached producer. If the call failed because the connection dropped
+    (broker restart, network), reconnect and retry once; the data service is stateless.
+    """
+    producer = _get_producer()
+    response = producer.call(queue_name, payload)
+    if not producer.connection.connected:
+        _reset_producer()
+        response = _get_producer().call(queue_name, payload)
+    return response
+
+
+@worker_process_init.connect(weak=False)
+def _warm_producer(**_kwargs):
+    """Open the worker's AMQP connection up front instead of on the first task."""
+    try:
+        _get_producer().connection.ensure_connection(max_retries=1)
+    except Exception:
+        pass  # Broker not reachable yet; the first task connects lazily
+
+
+@worker_process_shutdown.connect(weak=False)
+def _close_producer(**_kwargs):
+    _reset_producer()
+    _stop_record_writer()
+
+
+# Record writes are queued and bulk-inserted by one background thread per worker
+# process, so a task does not wait on a PostgreSQL checkout + commit. Unlike task_logs
+# these rows are not dropped: a full queue blocks the task (backpressure).
+_RECORD_QUEUE_MAXSIZE = 1_000
+_RECORD_BATCH_SIZE = 100
+_RECORD_FLUSH_INTERVAL_SECONDS = 0.05
+_RECORD_SHUTDOWN_TIMEOUT_SECONDS = 10
+_STOP = object()
+_record_queue: "queue.Queue[Any]" = queue.Queue(maxsize=_RECORD_QUEUE_MAXSIZE)
+_record_writer: Optional[threading.Thread] = None
+_record_writer_lock = threading.Lock()
+
+
+# UPSERT on the partial unique index (alembic 004): a redelivered task updates its
+# record in the same statement instead of failing the whole batch.
+_upsert_record = insert(DataProcessingRecord)
+_upsert_record = _upsert_record.on_conflict_do_update(
+    index_elements=["task_id"],
+    index_where=text("task_id <> '-'"),
+    set_={
+        "payload": _upsert_record.excluded.payload,
+        "description": _upsert_record.excluded.description,
+        "task_status": _upsert_record.excluded.task_status,
+        "outcome": _upsert_record.excluded.outcome,
+        "updated_at": func.now(),
+    },
+)
+
+
+def _insert_records(rows: List[Dict[str, Any]]) -> None:
+    """Upsert a batch of data_processing_records rows in one statement and one commit."""
+    # One statement may not touch the same row twice: keep the latest row per task_id
+    rows = list({row["task_id"]: row for row in rows}.values())
+    with engine.begin() as conn:
+        conn.execute(_upsert_record, rows)
+
+
+def _run_record_writer() -> None:
+    """Drain the record queue: flush every _RECORD_BATCH_SIZE rows or interval."""
+    stopping = False
+    while not stopping:
+        item = _record_queue.get()
+        if item is _STOP:
+            break
+        rows = [item]
+        deadline = time.monotonic() + _RECORD_FLUSH_INTERVAL_SECONDS
+        while len(rows) < _RECORD_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _record_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            rows.append(item)
+        try:
+            _insert_records(rows)
+        except Exception as e:
+            celery_log.error("Failed to save %d data records: %s", len(rows), str(e))
+
+
+def _ensure_record_writer() -> None:
+    """Start the background writer thread on first use (after fork, not at import)."""
+    global _record_writer
+    if _record_writer is not None:
+        return
+    with _record_writer_lock:
+        if _record_writer is None:
+            _record_writer = threading.Thread(
+                target=_run_record_writer, name="record-writer", daemon=True
+            )
+            _record_writer.start()
+
+
+def _stop_record_writer() -> None:
+    """Flush queued records and stop the writer (worker process shutdown)."""
+    global _record_writer
+    with _record_writer_lock:
+        writer, _record_writer = _record_writer, None
+    if writer is None:
+        return
+    _record_queue.put(_STOP)
+    writer.join(timeout=_RECORD_SHUTDOWN_TIMEOUT_SECONDS)
+
+
 def _save_async_record(
     task_id: str,
     payload_str: str,
@@ -27,35 +194,33 @@ def _save_async_record(
     outcome: str,
 ) -> None:
     """
-    Persist a data processing record to PostgreSQL (Celery worker uses sync engine).
+    Queue a data processing record for PostgreSQL (bulk-inserted by the writer thread).
     """
-    with Session(engine) as session:
-        record = DataProcessingRecord(
-            task_id=task_id,
-            payload=payload_str,
-            description=description,
-            task_type="data",
-            task_status=task_status,
-            outcome=outcome,
-        )
-        session.add(record)
-        session.commit()
+    _ensure_record_writer()
+    _record_queue.put(
+        {
+            "task_id": task_id,
+            "payload": payload_str,
+            "description": description,
+            "task_type": "data",
+            "task_status": task_status,
+            "outcome": outcome,
+        }
+    )
 
 
 @app.task(name="app.tasks.data.process_data_task")
-def process_data_task(payload: str) -> Dict[str, Any]:
+def process_data_task(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process data task asynchronously using Celery and RabbitMQ.
     Uses EventProducer to send message to data service via RabbitMQ queue.
     Persists a record to PostgreSQL on success or failure (async path integration).
+    The payload arrives as a dict, decoded once by Celery's task serializer.
     """
-    payload_json = json.loads(payload)
-    payload_json.pop(
-        "_trace_context", None
-    )  # trace context already applied in task_prerun
+    payload.pop("_trace_context", None)  # trace context already applied in task_prerun
     task_id = str(current_task.request.id)
-    payload_str = str(payload_json.get("payload", payload))
-    description = payload_json.get("description")
+    payload_str = str(payload.get("payload", payload))
+    description = payload.get("description")
 
     emit_log(
         "celery task start",
@@ -66,21 +231,10 @@ def process_data_task(payload: str) -> Dict[str, Any]:
         },
     )
 
-    # Queue name for data service
-    queue_name = os.getenv("DATA_QUEUE_NAME", "data_queue")
-
     try:
-        event_producer = EventProducer(
-            username=os.getenv("RABBITMQ_USER", "guest"),
-            password=os.getenv("RABBITMQ_PASSWORD", "welcome1"),
-            host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
-            port=int(os.getenv("RABBITMQ_PORT", "5672")),
-            service_name="api_celery_worker",
-        )
-
         # Send message to RabbitMQ queue and wait for response
-        response = event_producer.call(queue_name, json.dumps(payload_json))
-        response_json = json.loads(response)
+        response = _call_via_producer(_DATA_QUEUE_NAME, payload)
+        response_json = orjson.loads(response)
 
         # Persist to PostgreSQL to show async path integration
         _save_async_record(
@@ -88,7 +242,7 @@ def process_data_task(payload: str) -> Dict[str, Any]:
             payload_str=payload_str,
             description=description,
             task_status="Success",
-            outcome=json.dumps(
+            outcome=_dumps(
                 response_json
                 if isinstance(response_json, dict)
                 else {"result": response_json}
@@ -120,7 +274,7 @@ def process_data_task(payload: str) -> Dict[str, Any]:
             payload_str=payload_str,
             description=description,
             task_status="Failed",
-            outcome=json.dumps(error_payload),
+            outcome=_dumps(error_payload),
         )
         return error_payload
 
@@ -130,19 +284,11 @@ def process_generic_task(queue_name: str, payload: str) -> Dict[str, Any]:
     """
     Generic task processor for calling any service via RabbitMQ.
     """
-    payload_json = json.loads(payload)
+    payload_json = orjson.loads(payload)
 
     try:
-        event_producer = EventProducer(
-            username=os.getenv("RABBITMQ_USER", "guest"),
-            password=os.getenv("RABBITMQ_PASSWORD", "welcome1"),
-            host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
-            port=int(os.getenv("RABBITMQ_PORT", "5672")),
-            service_name="api_celery_worker",
-        )
-
-        response = event_producer.call(queue_name, json.dumps(payload_json))
-        result = json.loads(response)
+        response = _call_via_producer(queue_name, payload_json)
+        result = orjson.loads(response)
         celery_log.info(f"Task on queue {queue_name} completed")
         return result
 
@@ -3,15 +3,14 @@ FastAPI application entry point.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import api_router
 from app.core.database import init_db
 from app.core.idempotency import IdempotencyMiddleware
+from app.core.queue_metrics import close_client as close_queue_metrics_client
 from app.observability import init_observability
 
-# OpenTelemetry: set tracer provider (no-op if OTEL_EXPORTER_OTLP_ENDPOINT not set)
-init_observability()
-
 app = FastAPI(
     title="FastAPI Starter Kit",
     description="A production-ready FastAPI starter kit for large-scale applications",
@@ -19,6 +18,8 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    # orjson: faster serialization for list/record responses (e.g. /database, /metrics)
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -31,7 +32,8 @@ app.add_middleware(
 # Idempotency: optional Idempotency-Key header, Redis 1h TTL (no change to services/repos)
 app.add_middleware(IdempotencyMiddleware)
 
-# OpenTelemetry: auto-instrument FastAPI (traces for HTTP requests)
+# OpenTelemetry: providers + FastAPI auto-instrumentation
+# (no-op if OTEL_EXPORTER_OTLP_ENDPOINT not set)
 init_observability(app)
 
 
@@ -41,6 +43,12 @@ def on_startup():
     init_db()
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Release shared HTTP clients on application shutdown."""
+    await close_queue_metrics_client()
+
+
 # Include API routers
 app.include_router(api_router)
 
@@ -0,0 +1,130 @@
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure import rabbitmq
+from app.infrastructure.rabbitmq import EventReceiver
+
+
+class FakeChannel:
+    def __init__(self):
+        self.acks = []
+        self.nacks = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, multiple=False, requeue=True):
+        self.nacks.append((delivery_tag, multiple, requeue))
+
+
+class FakeMessage:
+    def __init__(self, channel, delivery_tag):
+        self.channel = channel
+        self.delivery_tag = delivery_tag
+        self.properties = {
+            "correlation_id": f"corr-{delivery_tag}",
+            "reply_to": f"reply-{delivery_tag}",
+        }
+        self.acked = False
+        self.rejected = False
+
+    def ack(self):
+        self.acked = True
+
+    def reject(self, requeue=False):
+        self.rejected = True
+
+
+class EchoService:
+    def call(self, body):
+        return body.encode(), "data"
+
+
+class FailingService:
+    def call(self, body):
+        raise RuntimeError("boom")
+
+
+def _receiver(service, monkeypatch, fail_reply_to=()):
+    receiver = EventReceiver(
+        "guest", "guest", "localhost", 5672, "data_queue", service, "data", 3
+    )
+    published = []
+
+    def publish_reply(producer, reply_to, correlation_id, response):
+        if reply_to in fail_reply_to:
+            raise ConnectionError("channel closed")
+        published.append((reply_to, response))
+
+    monkeypatch.setattr(receiver, "_publish_reply", publish_reply)
+    monkeypatch.setattr(receiver, "_reply_producer", lambda channel: None)
+    monkeypatch.setattr(rabbitmq, "_otel_emit_log", None)
+    return receiver, published
+
+
+@pytest.fixture
+def batch():
+    channel = FakeChannel()
+    messages = [FakeMessage(channel, tag) for tag in (1, 2, 3)]
+    return channel, messages
+
+
+def _flush(receiver, messages):
+    receiver._buffer = [('{"n": %d}' % m.delivery_tag, m) for m in messages]
+    receiver._flush_batch()
+
+
+def test_flush_batch_acks_all_in_one_frame(monkeypatch, batch):
+    channel, messages = batch
+    receiver, published = _receiver(EchoService, monkeypatch)
+
+    _flush(receiver, messages)
+
+    assert [reply_to for reply_to, _ in published] == ["reply-1", "reply-2", "reply-3"]
+    assert channel.acks == [(3, True)]
+    assert channel.nacks == []
+
+
+def test_flush_batch_rejects_only_the_message_whose_reply_failed(monkeypatch, batch):
+    channel, messages = batch
+    receiver, published = _receiver(EchoService, monkeypatch, fail_reply_to={"reply-2"})
+
+    _flush(receiver, messages)
+
+    assert [reply_to for reply_to, _ in published] == ["reply-1", "reply-3"]
+    assert not any(b"Receiver exception" in body for _, body in published)
+    assert [m.acked for m in messages] == [True, False, True]
+    assert [m.rejected for m in messages] == [False, True, False]
+    assert channel.acks == [] and channel.nacks == []
+
+
+def test_flush_batch_service_failure_nacks_whole_batch(monkeypatch, batch):
+    channel, messages = batch
+    receiver, published = _receiver(FailingService, monkeypatch)
+
+    _flush(receiver, messages)
+
+    assert [body["exception"] for _, body in published] == ["boom"] * 3
+    assert channel.nacks == [(3, True, False)]
+    assert channel.acks == []
+
+
+def test_connection_revived_drops_buffered_messages(monkeypatch, batch):
+    _, messages = batch
+    receiver, _ = _receiver(EchoService, monkeypatch)
+    receiver._buffer = [(SimpleNamespace(), m) for m in messages]
+
+    receiver.on_connection_revived()
+
+    assert receiver._buffer == []
+
+
+def test_body_str_encodes_container_subclasses_as_json():
+    body = OrderedDict([("payload", [1, 2]), ("description", "sort")])
+
+    assert json.loads(EventReceiver._body_str(body)) == dict(body)
+    assert EventReceiver._body_str([1, "a"]) == '[1,"a"]'
+    assert EventReceiver._body_str(b'{"a":1}') == '{"a":1}'
@@ -0,0 +1,17 @@
+import json
+
+import orjson
+
+from app.core.serialization import dumps
+
+
+def test_dumps_matches_orjson_for_regular_values():
+    obj = {"payload": [1, "a", None], "description": "x"}
+
+    assert dumps(obj) == orjson.dumps(obj)
+
+
+def test_dumps_falls_back_for_integers_beyond_64_bits():
+    obj = {"payload": 2**70, "description": "square"}
+
+    assert json.loads(dumps(obj)) == obj
@@ -1,6 +1,15 @@
-import json
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Dict, Union
+
+import orjson
+
+from app.observability import emit_log
+from app.serialization import dumps
+
+# Description keyword -> operation, checked in order (first match wins).
+_STRING_OPS = (("uppercase", str.upper), ("reverse", lambda s: s[::-1]))
+_NUMBER_OPS = (("square", lambda n: n**2), ("double", lambda n: n * 2))
+_LIST_OPS = (("reverse", lambda items: items[::-1]), ("sort", sorted))
 
 
 class DataService(object):
@@ -10,22 +19,27 @@ class DataService(object):
     No ML dependencies - just basic data transformation.
     """
 
+    # Stateless: one instance may serve all receiver worker threads
+    thread_safe = True
+
     def __init__(self):
         # No initialization needed for simple data processing
         pass
 
-    def call(self, data: str) -> tuple:
+    def call(self, data: Union[Dict[str, Any], str, bytes]) -> tuple:
         """
         Process incoming data.
 
         Args:
-            data: JSON string with 'payload', 'description', and 'task_type'
+            data: Request with 'payload', 'description', and 'task_type', either
+                already parsed (dict) or as JSON str/bytes
 
         Returns:
-            tuple: (response_json_string, task_type)
+            tuple: (response_json_bytes, task_type)
         """
+        now_iso = datetime.now(timezone.utc).isoformat()
         try:
-            data_json = json.loads(data)
+            data_json = data if isinstance(data, dict) else orjson.loads(data)
             payload = data_json.get("payload", "")
             description = data_json.get("description", "")
             task_type = data_json.get("task_type", "data")
@@ -36,37 +50,38 @@ class DataService(object):
             # Create response
             response = {
                 "status": "success",
-                "processed_at": datetime.now(timezone.utc).isoformat(),
+                "processed_at": now_iso,
                 "input": payload,
                 "description": description,
                 "output": processed_data,
                 "metadata": {
-                    "input_length": len(str(payload)),
+                    "input_length": (
+                        len(payload) if isinstance(payload, str) else len(str(payload))
+                    ),
                     "processing_time_ms": 10,  # Simulated
                 },
             }
 
-            print(f"Processed data: {description or 'No description'}")
-            print(f"Input: {payload}")
-            print(f"Output: {processed_data}")
+            emit_log(
+                f"processed: {description or 'No description'}",
+                attributes={"input_len": response["metadata"]["input_length"]},
+            )
 
-            return json.dumps(response), task_type
+            return dumps(response), task_type
 
-        except json.JSONDecodeError as e:
-            error_response = {
-                "status": "error",
-                "error": f"Invalid JSON: {str(e)}",
-                "processed_at": datetime.now(timezone.utc).isoformat(),
-            }
-            return json.dumps(error_response), "error"
+        except orjson.JSONDecodeError as e:
+            return self._error_response(f"Invalid JSON: {str(e)}", now_iso), "error"
         except Exception as e:  # pylint: disable=broad-except
             # Catch all exceptions to ensure service always returns a response
-            error_response = {
-                "status": "error",
-                "error": f"Processing failed: {str(e)}",
-                "processed_at": datetime.now(timezone.utc).isoformat(),
-            }
-            return json.dumps(error_response), "error"
+            return (
+                self._error_response(f"Processing failed: {str(e)}", now_iso),
+                "error",
+            )
+
+    @staticmethod
+    def _error_response(error: str, processed_at: str) -> bytes:
+        """Serialize an error response."""
+        return dumps({"status": "error", "error": error, "processed_at": processed_at})
 
     def process_data(self, payload: Any, description: str = "") -> Any:
         """
@@ -96,28 +111,28 @@ class DataService(object):
 
     def _process_string(self, payload: str, desc_lower: str) -> str:
         """Process string input."""
-        if "uppercase" in desc_lower:
-            return payload.upper()
-        elif "reverse" in desc_lower:
-            return payload[::-1]
+        for keyword, op in _STRING_OPS:
+            if keyword in desc_lower:
+                return op(payload)
         return f"Processed: {payload}"
 
     def _process_number(self, payload: float, desc_lower: str) -> float:
         """Process number input."""
-        if "square" in desc_lower:
-            return payload**2
-        elif "double" in desc_lower:
-            return payload * 2
+        for keyword, op in _NUMBER_OPS:
+            if keyword in desc_lower:
+                return op(payload)
         return payload
 
     def _process_list(self, payload: list, desc_lower: str) -> Any:
         """Process list input."""
-        if "reverse" in desc_lower:
-            return list(reversed(payload))
-        elif "sort" in desc_lower:
-            return sorted(payload)
+        for keyword, op in _LIST_OPS:
+            if keyword in desc_lower:
+                return op(payload)
         return {"items": payload, "count": len(payload), "processed": True}
 
     def _process_dict(self, payload: dict) -> dict:
         """Process dict input."""
-        return {**payload, "processed": True, "keys_count": len(payload.keys())}
+        out = payload.copy()
+        out["processed"] = True
+        out["keys_count"] = len(payload)
+        return out
@@ -3,10 +3,23 @@ OpenTelemetry setup for data-service: traces and logs exported via OTLP to the c
 Init once at process startup; when OTEL_EXPORTER_OTLP_ENDPOINT is not set, all signals are no-op.
 """
 import os
+import threading
 from typing import Any, Dict, Optional
 
+# OTel API modules imported once; per-request helpers are no-ops when it is missing.
+try:
+    from opentelemetry import propagate as _propagate
+    from opentelemetry import trace as _trace
+except ImportError:
+    _propagate = None
+    _trace = None
+
 _otel_logger = None
 
+# Providers are set up once per process; re-entry is a no-op.
+_initialized = False
+_init_lock = threading.Lock()
+
 
 def _normalize_endpoint(endpoint: str) -> str:
     """Strip http(s) scheme for gRPC."""
@@ -23,10 +36,20 @@ def init_observability() -> None:
     Call once from main before starting the receiver.
     If OTEL_EXPORTER_OTLP_ENDPOINT is not set, does nothing (no-op).
     """
+    global _initialized
     endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip()
     if not endpoint:
         return
 
+    with _init_lock:
+        if _initialized:
+            return
+        _initialized = True
+        _init_providers(endpoint)
+
+
+def _init_providers(endpoint: str) -> None:
+    """Set the global tracer and logger providers with OTLP exporters."""
     grpc_endpoint = _normalize_endpoint(endpoint)
     service_name = os.getenv("OTEL_SERVICE_NAME", "data-service")
 
@@ -76,33 +99,38 @@ def init_observability() -> None:
 
 def get_tracer(name: str = __name__, version: str = "1.0.0"):
     """Return the OTel tracer if tracing is enabled, else None."""
+    if _trace is None:
+        return None
     try:
-        from opentelemetry import trace
-
-        return trace.get_tracer(name, version)
+        return _trace.get_tracer(name, version)
     except Exception:
         return None
 
 
+def use_span(span, end_on_exit: bool = False):
+    """Context manager making span the current span; ends it on exit if end_on_exit."""
+    return _trace.use_span(span, end_on_exit=end_on_exit)
+
+
 def extract_trace_context(carrier: Dict[str, str]):
     """
     Extract trace context from a carrier (e.g. incoming RabbitMQ message headers).
     Returns a Context to use as parent when starting a span, or None if none/invalid.
     """
+    if _propagate is None:
+        return None
     try:
-        from opentelemetry import propagate
-
-        return propagate.extract(carrier)
+        return _propagate.extract(carrier)
     except Exception:
         return None
 
 
 def _get_trace_context_attributes() -> Dict[str, str]:
     """Return trace_id and span_id from current span for log-trace correlation in SigNoz."""
+    if _trace is None:
+        return {}
     try:
-        from opentelemetry import trace
-
-        span = trace.get_current_span()
+        span = _trace.get_current_span()
         if not span.is_recording():
             return {}
         ctx = span.get_span_context()
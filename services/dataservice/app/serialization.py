@@ -0,0 +1,16 @@
+"""
+JSON encoding for replies: orjson, falling back to the stdlib for values orjson
+rejects (integers outside the 64-bit range).
+"""
+import json
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON-encode obj to UTF-8 bytes."""
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":")).encode()
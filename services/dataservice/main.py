@@ -1,23 +1,59 @@
+import logging
 import os
 
-from rabbitmq_client import EventReceiver
+from rabbitmq_client import AsyncEventReceiver, EventReceiver
 
 from app.data_service import DataService
 from app.observability import init_observability
 
+# Receiver logs to stderr; LOG_LEVEL=DEBUG adds a line per processed request
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+
 # OpenTelemetry: traces and logs to otel-collector (no-op if OTEL_EXPORTER_OTLP_ENDPOINT unset)
 init_observability()
 
+RABBITMQ_USER = os.getenv("RABBITMQ_USER", "guest")
+RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "welcome1")
+RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "rabbitmq")
+RABBITMQ_PORT = int(os.getenv("RABBITMQ_PORT", "5672"))
+QUEUE_NAME = os.getenv("QUEUE_NAME", "data_queue")
+SERVICE_NAME = os.getenv("SERVICE_NAME", "data")
+PREFETCH_COUNT = int(os.getenv("PREFETCH_COUNT", "100"))
+WORKERS = int(os.getenv("WORKERS", "1"))
+USE_LIBRABBITMQ = os.getenv("USE_LIBRABBITMQ", "false").lower() == "true"
+ASYNC_RECEIVER = os.getenv("ASYNC_RECEIVER", "false").lower() == "true"
+CONCURRENCY = int(os.getenv("CONCURRENCY", "128"))
+
 
 def main():
+    if ASYNC_RECEIVER:
+        AsyncEventReceiver(
+            username=RABBITMQ_USER,
+            password=RABBITMQ_PASSWORD,
+            host=RABBITMQ_HOST,
+            port=RABBITMQ_PORT,
+            queue_name=QUEUE_NAME,
+            service=DataService,
+            service_name=SERVICE_NAME,
+            prefetch_count=PREFETCH_COUNT,
+            concurrency=CONCURRENCY,
+        ).run()
+        return
+
     event_receiver = EventReceiver(
-        username=os.getenv("RABBITMQ_USER", "guest"),
-        password=os.getenv("RABBITMQ_PASSWORD", "welcome1"),
-        host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
-        port=int(os.getenv("RABBITMQ_PORT", "5672")),
-        queue_name=os.getenv("QUEUE_NAME", "data_queue"),
+        username=RABBITMQ_USER,
+        password=RABBITMQ_PASSWORD,
+        host=RABBITMQ_HOST,
+        port=RABBITMQ_PORT,
+        queue_name=QUEUE_NAME,
         service=DataService,
-        service_name=os.getenv("SERVICE_NAME", "data"),
+        service_name=SERVICE_NAME,
+        prefetch_count=PREFETCH_COUNT,
+        workers=WORKERS,
+        use_librabbitmq=USE_LIBRABBITMQ,
     )
     # Start consuming messages (ConsumerMixin.run() starts the consumer loop)
     event_receiver.run()
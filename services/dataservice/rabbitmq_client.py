@@ -3,15 +3,40 @@ RabbitMQ client for data service using kombu.
 Lightweight implementation using industry-standard kombu library.
 Uses a Dead Letter Exchange (DLX) and Dead Letter Queue (DLQ): failed messages
 are nack'd with requeue=False and routed to the DLQ for inspection/retry.
+AsyncEventReceiver is an asyncio (aio-pika) variant for IO-bound services.
 """
-import json
+import asyncio
+import logging
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
-from typing import Callable
+from itertools import count
+from typing import Callable, Optional
 
+import orjson
 from kombu import Connection, Exchange, Producer, Queue
 from kombu.mixins import ConsumerMixin
+from kombu.serialization import register
 
-_null_context = nullcontext
+from app.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Reusable no-op span context for receivers without a tracer
+_NOOP_SPAN = nullcontext()
+# Shared carrier for messages without headers (only ever read by the propagator)
+_EMPTY_CARRIER = {}
+# AMQP heartbeat negotiated with the broker (seconds)
+HEARTBEAT_SECONDS = 30
+# AMQP transports: librabbitmq (C rabbitmq-c bindings) when requested and
+# installed, else kombu's pure-Python py-amqp
+_LIBRABBITMQ_TRANSPORT = "librabbitmq"
+_PYAMQP_TRANSPORT = "pyamqp"
+# How often the consumer loop checks for replies finished by the worker pool while
+# requests are in flight (seconds); idle, it blocks for the usual safety_interval
+_COMPLETION_POLL_INTERVAL = 0.005
 
 
 def _get_tracer_none(*_a, **_k):
@@ -20,18 +45,177 @@ def _get_tracer_none(*_a, **_k):
 
 try:
     from app.observability import emit_log as _otel_emit_log
-    from app.observability import extract_trace_context, get_tracer
+    from app.observability import extract_trace_context, get_tracer, use_span
 except ImportError:
     _otel_emit_log = None
     extract_trace_context = None
     get_tracer = _get_tracer_none
+    use_span = None
+
+try:
+    import aio_pika
+except ImportError:
+    aio_pika = None
+
+try:
+    import librabbitmq  # noqa: F401
+
+    _HAS_LIBRABBITMQ = True
+except ImportError:
+    _HAS_LIBRABBITMQ = False
 
 # Dead letter: exchange and queue names (suffix to main queue name)
 DLX_SUFFIX = "_dlx"
 DLQ_SUFFIX = "_dlq"
 
+# orjson as the kombu serializer under the application/json content type, so it
+# stays wire-compatible with "json" and also decodes every inbound JSON body.
+SERIALIZER = "orjson"
+ACCEPT = [SERIALIZER, "json"]
+register(
+    SERIALIZER,
+    dumps,
+    orjson.loads,
+    content_type="application/json",
+    content_encoding="utf-8",
+)
+
 
-class EventReceiver(ConsumerMixin):
+class _ReceiverBase:
+    """Service dispatch, tracing and lifecycle logging shared by both receivers."""
+
+    def _init_receiver(
+        self, queue_name: str, service: Callable, service_name: str, threaded: bool
+    ):
+        """Set up the service instance(s), error template and tracing."""
+        self.service_worker = service
+        self.service_name = service_name
+        self.queue_name = queue_name
+        self._service_instance = service()
+        self._thread_services = (
+            threading.local()
+            if threaded and not getattr(service, "thread_safe", False)
+            else None
+        )
+        # Fields shared by every error reply
+        self._error_template = {
+            "error": "Receiver exception",
+            "queue": queue_name,
+            "service_name": service_name,
+        }
+        # Tracing capabilities are fixed for the receiver's lifetime: resolve them once
+        self._tracer = get_tracer(__name__, "1.0.0") if callable(get_tracer) else None
+        self._extract = (
+            extract_trace_context if callable(extract_trace_context) else None
+        )
+
+    def _message_headers(self, message) -> Optional[dict]:
+        """Return the AMQP headers of a message."""
+        return getattr(message, "headers", None)
+
+    def _headers_carrier(self, message):
+        """Build a string-keyed dict from message headers for trace context extraction."""
+        headers = self._message_headers(message)
+        if not headers or not isinstance(headers, dict):
+            return _EMPTY_CARRIER
+        return {str(k): str(v) for k, v in headers.items() if v is not None}
+
+    def _start_span(self, message):
+        """
+        Start the message.process span under the producer's trace context, or return
+        None without a tracer. The caller ends it (see _span_scope).
+        """
+        if self._tracer is None:
+            return None
+        # Headers are only read when there is a span to parent; context=None
+        # starts the span under the current (empty) context
+        remote_ctx = (
+            self._extract(self._headers_carrier(message)) if self._extract else None
+        )
+        return self._tracer.start_span("message.process", context=remote_ctx)
+
+    def _span_scope(self, span, end: bool = False):
+        """Make span current for a with-block; end it on exit when end=True."""
+        if span is None or use_span is None:
+            return _NOOP_SPAN
+        return use_span(span, end_on_exit=end)
+
+    def _process(self, body, correlation_id: str, message) -> tuple:
+        """
+        Run the service for one message inside its span.
+        Returns (response, task_type, error, span); never raises. The span stays open
+        so the reply and end log are recorded in it: reply under _span_scope(span, end=True).
+        """
+        service_instance = self._service()
+        span = self._start_span(message)
+        try:
+            with self._span_scope(span):
+                # The body arrives decoded (a dict, or a JSON string from older
+                # producers); the service takes either without re-encoding
+                if span is not None:
+                    span.set_attribute(
+                        "messaging.message.correlation_id", correlation_id
+                    )
+                    span.add_event("processing.start")
+
+                response, task_type = service_instance.call(body)
+
+                if span is not None:
+                    span.add_event("processing.end", {"task_type": task_type})
+                return response, task_type, None, span
+        except Exception as e:
+            return None, None, e, span
+
+    def _service(self):
+        """Return the service instance for the calling thread."""
+        if self._thread_services is None:
+            return self._service_instance
+        instance = getattr(self._thread_services, "instance", None)
+        if instance is None:
+            instance = self._thread_services.instance = self.service_worker()
+        return instance
+
+    def _error_response(self, correlation_id: str, error: Exception) -> dict:
+        return {
+            **self._error_template,
+            "correlation_id": correlation_id,
+            "exception": str(error),
+        }
+
+    def _finish(
+        self,
+        correlation_id: str,
+        task_type: Optional[str],
+        error: Optional[Exception] = None,
+    ):
+        """Record the end of a request: OTel end event plus a process log line."""
+        if error is None:
+            self._log_event(correlation_id, "end", "-")
+            logger.debug("Processed request: %s", task_type)
+        else:
+            self._log_event(correlation_id, "end", f"Receiver exception: {str(error)}")
+            logger.error("Receiver exception: %s", error)
+
+    def _log_event(self, correlation_id: str, status: str, description: str):
+        """Emit OTel log when enabled (receiver lifecycle: start/end). Includes trace_id from current span."""
+        if _otel_emit_log is not None:
+            try:
+                _otel_emit_log(
+                    body=f"receiver {status}",
+                    attributes={
+                        "layer": "receiver",
+                        "correlation_id": correlation_id,
+                        "queue_name": self.queue_name,
+                        "service_name": self.service_name,
+                        "status": status,
+                        "description": description,
+                    },
+                )
+            except Exception:
+                pass
+
+
+class EventReceiver(ConsumerMixin, _ReceiverBase):
     """
     RabbitMQ event receiver using kombu for listening to queues and processing messages.
     """
@@ -45,6 +229,9 @@ class EventReceiver(ConsumerMixin):
         queue_name: str,
         service: Callable,
         service_name: str,
+        prefetch_count: int = 100,
+        workers: int = 1,
+        use_librabbitmq: bool = False,
     ):
         """
         Initialize EventReceiver with kombu.
@@ -55,168 +242,420 @@ class EventReceiver(ConsumerMixin):
             host: RabbitMQ host
             port: RabbitMQ port
             queue_name: Name of the queue to listen to
-            service: Service class that processes messages
+            service: Service class that processes messages; instantiated once and
+                reused. With workers > 1 the instance is shared across threads only
+                if the class sets thread_safe = True, else each thread gets its own.
             service_name: Name of the service
+            prefetch_count: Unacked messages the broker may push ahead of acks
+                (1 = one network round trip per message)
+            workers: Threads running service.call concurrently (1 = inline on the
+                consumer thread). Replies and acks always go out on the consumer thread.
+            use_librabbitmq: Use the librabbitmq C transport for faster frame
+                encoding/decoding; falls back to py-amqp when it is not installed
         """
-        self.service_worker = service
-        self.service_name = service_name
-        self.queue_name = queue_name
-
-        # Create connection
-        connection_url = f"amqp://{username}:{password}@{host}:{port}//"
-        self.connection = Connection(connection_url)
-
-        print(f"Awaiting requests from [x] {queue_name} [x]")
-
-    def get_consumers(self, consumer_cls, channel):
-        """Set up consumer for the queue with Dead Letter Exchange and DLQ."""
-        dlx_name = self.queue_name + DLX_SUFFIX
-        dlq_name = self.queue_name + DLQ_SUFFIX
-        dlx = Exchange(dlx_name, type="direct", durable=True)
-        dlx.declare(channel=channel)
-        dlq = Queue(
-            dlq_name,
-            exchange=dlx,
-            routing_key=dlq_name,
-            durable=True,
+        self.workers = max(1, workers)
+        # Keep every worker fed: at least one unacked message per worker
+        self.prefetch_count = max(1, prefetch_count, self.workers)
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="service")
+            if self.workers > 1
+            else None
         )
-        dlq.declare(channel=channel)
-        main_queue = Queue(
-            self.queue_name,
+        # (message, reply_to, correlation_id, response, task_type, error, span)
+        # from workers
+        self._completed = queue.SimpleQueue()
+        # Requests submitted to the pool and not yet replied to (consumer thread only)
+        self._in_flight = 0
+        self._init_receiver(
+            queue_name, service, service_name, threaded=self._pool is not None
+        )
+        # Reply Producers keyed by id(channel); rebuilt when the consumer reconnects
+        self._producer_cache = {}
+        # DLX/DLQ topology: unbound kombu entities, declared on the broker once
+        dlx_name = queue_name + DLX_SUFFIX
+        dlq_name = queue_name + DLQ_SUFFIX
+        self._dlx = Exchange(dlx_name, type="direct", durable=True)
+        self._dlq = Queue(
+            dlq_name, exchange=self._dlx, routing_key=dlq_name, durable=True
+        )
+        self._main_queue = Queue(
+            queue_name,
             durable=True,
             queue_arguments={
                 "x-dead-letter-exchange": dlx_name,
                 "x-dead-letter-routing-key": dlq_name,
             },
         )
+        self._topology_declared = False
+
+        # Create connection
+        connection_url = f"amqp://{username}:{password}@{host}:{port}//"
+        if use_librabbitmq and not _HAS_LIBRABBITMQ:
+            logger.warning("librabbitmq is not installed; using py-amqp")
+        transport = (
+            _LIBRABBITMQ_TRANSPORT
+            if use_librabbitmq and _HAS_LIBRABBITMQ
+            else _PYAMQP_TRANSPORT
+        )
+        # Heartbeats let the broker and the consume loop (which runs heartbeat_check
+        # on idle wakeups) notice a dead connection within about two intervals
+        self.connection = Connection(
+            connection_url, heartbeat=HEARTBEAT_SECONDS, transport=transport
+        )
+
+        logger.info("Awaiting requests from [x] %s [x]", queue_name)
+
+    def get_consumers(self, consumer_cls, channel):
+        """
+        Set up consumer for the queue with Dead Letter Exchange and DLQ.
+        The durable topology is declared once and again only after a consume
+        failure (see consume), not on every call.
+        """
+        if not self._topology_declared:
+            self._dlx.declare(channel=channel)
+            self._dlq.declare(channel=channel)
+            self._main_queue.declare(channel=channel)
+            self._topology_declared = True
         return [
             consumer_cls(
-                queues=[main_queue],
+                queues=[self._main_queue],
                 callbacks=[self.on_request],
-                prefetch_count=1,
+                prefetch_count=self.prefetch_count,
+                accept=ACCEPT,
+                auto_declare=False,
             )
         ]
 
-    def _headers_carrier(self, message):
-        """Build a string-keyed dict from message headers for trace context extraction."""
-        headers = (
-            getattr(message, "headers", None)
-            or message.properties.get("application_headers")
-            or {}
-        )
-        if not isinstance(headers, dict):
-            return {}
-        return {str(k): str(v) for k, v in headers.items() if v is not None}
+    def consume(self, limit=None, timeout=None, safety_interval=1, **kwargs):
+        """
+        ConsumerMixin.consume, except that the loop only wakes every
+        _COMPLETION_POLL_INTERVAL while worker-pool requests are in flight, and that
+        any failure makes the next connection redeclare the topology.
+        """
+        elapsed = 0
+        try:
+            with self.consumer_context(**kwargs) as (conn, _channel, _consumers):
+                for _ in limit and range(limit) or count():
+                    if self.should_stop:
+                        break
+                    self.on_iteration()
+                    interval = (
+                        _COMPLETION_POLL_INTERVAL
+                        if self._in_flight
+                        else safety_interval
+                    )
+                    try:
+                        conn.drain_events(timeout=interval)
+                    except socket.timeout:
+                        conn.heartbeat_check()
+                        elapsed += interval
+                        if timeout and elapsed >= timeout:
+                            raise
+                    except OSError:
+                        if not self.should_stop:
+                            raise
+                    else:
+                        yield
+                        elapsed = 0
+        except Exception:
+            # The broker may have lost the topology (restart, deleted queue): without
+            # a redeclare, basic.consume would fail with NOT_FOUND on every reconnect
+            self._topology_declared = False
+            raise
+
+    def on_connection_revived(self):
+        """Forget reply Producers bound to channels of the previous connection."""
+        self._producer_cache.clear()
+
+    def _reply_producer(self, channel) -> Producer:
+        """Return the cached reply Producer for channel, creating it on first use."""
+        producer = self._producer_cache.get(id(channel))
+        if producer is None:
+            producer = self._producer_cache[id(channel)] = Producer(channel)
+        return producer
+
+    def _message_headers(self, message) -> Optional[dict]:
+        return message.headers or message.properties.get("application_headers")
 
     def on_request(self, body, message):
-        """Handle incoming message."""
-        service_instance = self.service_worker()
-        correlation_id = message.properties.get("correlation_id", "unknown")
+        """Handle incoming message (hand it to the worker pool when one is configured)."""
+        props = message.properties
+        correlation_id = props.get("correlation_id", "unknown")
+        reply_to = props.get("reply_to")
 
         self._log_event(correlation_id, "start", "-")
 
-        tracer = get_tracer(__name__, "1.0.0") if callable(get_tracer) else None
-        carrier = self._headers_carrier(message)
-        remote_ctx = (
-            extract_trace_context(carrier) if callable(extract_trace_context) else None
-        )
-        if tracer and remote_ctx is not None:
-            span_ctx = tracer.start_as_current_span(
-                "message.process", context=remote_ctx
+        if self._pool is None:
+            *result, span = self._process(body, correlation_id, message)
+            with self._span_scope(span, end=True):
+                self._reply(message, reply_to, correlation_id, *result)
+            return
+
+        self._in_flight += 1
+        future = self._pool.submit(self._process, body, correlation_id, message)
+        future.add_done_callback(
+            lambda f: self._completed.put(
+                (message, reply_to, correlation_id) + f.result()
             )
-        elif tracer:
-            span_ctx = tracer.start_as_current_span("message.process")
-        else:
-            span_ctx = _null_context()
-        try:
-            with span_ctx:
-                # Process message - convert body to string if needed
-                if isinstance(body, dict):
-                    body_str = json.dumps(body)
-                elif isinstance(body, bytes):
-                    body_str = body.decode("utf-8")
-                else:
-                    body_str = str(body)
-
-                if _otel_emit_log is not None:
-                    try:
-                        _otel_emit_log(
-                            "data-service processing start",
-                            attributes={
-                                "layer": "dataservice",
-                                "correlation_id": correlation_id,
-                                "queue_name": self.queue_name,
-                            },
-                        )
-                    except Exception:
-                        pass
-
-                response, task_type = service_instance.call(body_str)
-
-                if _otel_emit_log is not None:
-                    try:
-                        _otel_emit_log(
-                            "data-service processing end",
-                            attributes={
-                                "layer": "dataservice",
-                                "correlation_id": correlation_id,
-                                "task_type": task_type,
-                            },
-                        )
-                    except Exception:
-                        pass
-
-                # Send response
-                producer = Producer(message.channel)
+        )
+
+    def on_iteration(self):
+        """Reply to and ack requests finished by the worker pool (connection thread)."""
+        while True:
+            try:
+                item = self._completed.get_nowait()
+            except queue.Empty:
+                return
+            self._in_flight -= 1
+            *item, span = item
+            try:
+                with self._span_scope(span, end=True):
+                    self._reply(*item)
+            except Exception as e:
+                # Channel gone (reconnect): the broker redelivers the unacked message
+                logger.error("Could not reply to request: %s", e)
+
+    def _reply(
+        self,
+        message,
+        reply_to: Optional[str],
+        correlation_id: str,
+        response,
+        task_type: Optional[str],
+        error: Optional[Exception],
+    ):
+        """
+        Publish the reply and ack, or publish an error reply and reject. A failed
+        reply publish is rejected without an error reply.
+        The reply queue is the caller's own and exists while it waits, so replies skip
+        declaration and retries: an undeliverable reply ends in a caller timeout anyway.
+        """
+        producer = self._reply_producer(message.channel)
+        if error is None:
+            try:
+                # Send response: already JSON bytes, published without re-serializing
                 producer.publish(
                     response,
                     exchange="",
-                    routing_key=message.properties.get("reply_to"),
+                    routing_key=reply_to,
                     correlation_id=correlation_id,
-                    serializer="json",
-                    retry=True,
+                    content_type="application/json",
+                    content_encoding="utf-8",
+                    retry=False,
+                    declare=[],
                 )
+            except Exception as e:
+                # The channel or broker failed us: an error reply would fail the same
+                # way, so go straight to the reject
+                self._finish(correlation_id, None, e)
+                message.reject(requeue=False)
+                return
+            message.ack()
+            self._finish(correlation_id, task_type)
+            return
 
-                message.ack()
-                self._log_event(correlation_id, "end", "-")
-                print(f"Processed request: {task_type}")
-
-        except Exception as e:
-            response = {
-                "error": "Receiver exception",
-                "queue": self.queue_name,
-                "service_name": self.service_name,
-                "correlation_id": correlation_id,
-                "exception": str(e),
-            }
-            producer = Producer(message.channel)
+        response = self._error_response(correlation_id, error)
+        try:
             producer.publish(
                 response,
                 exchange="",
-                routing_key=message.properties.get("reply_to"),
+                routing_key=reply_to,
                 correlation_id=correlation_id,
-                serializer="json",
-                retry=True,
+                serializer=SERIALIZER,
+                retry=False,
+                declare=[],
             )
-            self._log_event(correlation_id, "end", f"Receiver exception: {str(e)}")
-            print(f"Receiver exception: {str(e)}")
-            # Reject so message is dead-lettered to DLQ for inspection/retry
-            message.reject(requeue=False)
+        except Exception as e:
+            logger.error("Could not send error reply: %s", e)
+        self._finish(correlation_id, None, error)
+        # Reject so message is dead-lettered to DLQ for inspection/retry
+        message.reject(requeue=False)
 
-    def _log_event(self, correlation_id: str, status: str, description: str):
-        """Emit OTel log when enabled (receiver lifecycle: start/end). Includes trace_id from current span."""
-        if _otel_emit_log is not None:
-            try:
-                _otel_emit_log(
-                    body=f"receiver {status}",
-                    attributes={
-                        "layer": "receiver",
-                        "correlation_id": correlation_id,
-                        "queue_name": self.queue_name,
-                        "service_name": self.service_name,
-                        "status": status,
-                        "description": description,
-                    },
+
+class AsyncEventReceiver(_ReceiverBase):
+    """
+    asyncio RabbitMQ event receiver using aio-pika, for IO-bound services: up to
+    `concurrency` requests are in flight on one connection instead of one per
+    consumer thread. Same queue topology, replies and tracing as EventReceiver.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        host: str,
+        port: int,
+        queue_name: str,
+        service: Callable,
+        service_name: str,
+        prefetch_count: int = 200,
+        concurrency: int = 128,
+    ):
+        """
+        Initialize AsyncEventReceiver with aio-pika.
+
+        Args:
+            username: RabbitMQ username
+            password: RabbitMQ password
+            host: RabbitMQ host
+            port: RabbitMQ port
+            queue_name: Name of the queue to listen to
+            service: Service class that processes messages; instantiated once. A
+                coroutine call runs on the event loop; a plain call runs on a thread
+                pool, sharing the instance only if the class sets thread_safe = True.
+            service_name: Name of the service
+            prefetch_count: Unacked messages the broker may push ahead of acks
+            concurrency: Max requests processed at once
+        """
+        if aio_pika is None:
+            raise ImportError("AsyncEventReceiver requires aio-pika")
+        self.concurrency = max(1, concurrency)
+        self.prefetch_count = max(1, prefetch_count)
+        self._init_receiver(queue_name, service, service_name, threaded=True)
+        self._call_async = asyncio.iscoroutinefunction(self._service_instance.call)
+        self._pool = (
+            None
+            if self._call_async
+            else ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="service"
+            )
+        )
+        self._channel = None
+        self._url = f"amqp://{username}:{password}@{host}:{port}/"
+
+        logger.info("Awaiting requests from [x] %s [x]", queue_name)
+
+    def run(self):
+        """Start consuming on a new event loop (blocks)."""
+        asyncio.run(self.consume())
+
+    async def consume(self):
+        """Declare the DLX/DLQ topology and process messages until the connection closes."""
+        dlx_name = self.queue_name + DLX_SUFFIX
+        dlq_name = self.queue_name + DLQ_SUFFIX
+        # Robust connection: reconnects and restores channel, QoS and consumer itself
+        connection = await aio_pika.connect_robust(
+            self._url, heartbeat=HEARTBEAT_SECONDS
+        )
+        async with connection:
+            self._channel = await connection.channel()
+            await self._channel.set_qos(prefetch_count=self.prefetch_count)
+            dlx = await self._channel.declare_exchange(
+                dlx_name, aio_pika.ExchangeType.DIRECT, durable=True
+            )
+            dlq = await self._channel.declare_queue(dlq_name, durable=True)
+            await dlq.bind(dlx, routing_key=dlq_name)
+            main_queue = await self._channel.declare_queue(
+                self.queue_name,
+                durable=True,
+                arguments={
+                    "x-dead-letter-exchange": dlx_name,
+                    "x-dead-letter-routing-key": dlq_name,
+                },
+            )
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            tasks = set()
+
+            def on_done(task):
+                tasks.discard(task)
+                semaphore.release()
+                if not task.cancelled() and task.exception() is not None:
+                    # Channel gone (reconnect): the broker redelivers the unacked message
+                    logger.error("Could not reply to request: %s", task.exception())
+
+            async with main_queue.iterator() as messages:
+                async for message in messages:
+                    await semaphore.acquire()
+                    task = asyncio.ensure_future(self._handle(message))
+                    tasks.add(task)
+                    task.add_done_callback(on_done)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _handle(self, message):
+        """Process one message and reply; errors are replied to and dead-lettered."""
+        correlation_id = message.correlation_id or "unknown"
+        self._log_event(correlation_id, "start", "-")
+        try:
+            body = orjson.loads(message.body)
+        except orjson.JSONDecodeError as e:
+            result = (None, None, e, None)
+        else:
+            if self._call_async:
+                result = await self._process_async(body, correlation_id, message)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, self._process, body, correlation_id, message
                 )
-            except Exception:
-                pass
+        *result, span = result
+        with self._span_scope(span, end=True):
+            await self._reply(message, correlation_id, *result)
+
+    async def _process_async(self, body, correlation_id: str, message) -> tuple:
+        """
+        Await a coroutine service call inside its span (see _process).
+        Returns (response, task_type, error, span); never raises.
+        """
+        span = self._start_span(message)
+        try:
+            with self._span_scope(span):
+                if span is not None:
+                    span.set_attribute(
+                        "messaging.message.correlation_id", correlation_id
+                    )
+                    span.add_event("processing.start")
+
+                response, task_type = await self._service_instance.call(body)
+
+                if span is not None:
+                    span.add_event("processing.end", {"task_type": task_type})
+                return response, task_type, None, span
+        except Exception as e:
+            return None, None, e, span
+
+    async def _reply(
+        self,
+        message,
+        correlation_id: str,
+        response,
+        task_type: Optional[str],
+        error: Optional[Exception],
+    ):
+        """Publish the reply and ack, or publish an error reply and reject (as EventReceiver)."""
+        if error is None:
+            try:
+                # Response is already JSON bytes
+                await self._publish_reply(message.reply_to, correlation_id, response)
+            except Exception as e:
+                self._finish(correlation_id, None, e)
+                await message.reject(requeue=False)
+                return
+            await message.ack()
+            self._finish(correlation_id, task_type)
+            return
+
+        try:
+            await self._publish_reply(
+                message.reply_to,
+                correlation_id,
+                dumps(self._error_response(correlation_id, error)),
+            )
+        except Exception as e:
+            logger.error("Could not send error reply: %s", e)
+        self._finish(correlation_id, None, error)
+        # Reject so message is dead-lettered to DLQ for inspection/retry
+        await message.reject(requeue=False)
+
+    async def _publish_reply(
+        self, reply_to: Optional[str], correlation_id: str, body: bytes
+    ):
+        await self._channel.default_exchange.publish(
+            aio_pika.Message(
+                body,
+                content_type="application/json",
+                content_encoding="utf-8",
+                correlation_id=correlation_id,
+            ),
+            routing_key=reply_to,
+        )
@@ -0,0 +1,20 @@
+import json
+
+from app.data_service import DataService
+
+
+def test_call_squares_number_beyond_64_bits():
+    response, task_type = DataService().call(
+        {"payload": 5000000000, "description": "square", "task_type": "data"}
+    )
+
+    result = json.loads(response)
+    assert task_type == "data"
+    assert result["status"] == "success"
+    assert result["output"] == 5000000000**2
+
+
+def test_call_keeps_orjson_output_for_regular_payloads():
+    response, _ = DataService().call({"payload": "abc", "description": "uppercase"})
+
+    assert json.loads(response)["output"] == "ABC"